@@ -63,6 +63,10 @@ logger.debug("METADATA_CATEGORIES defined: %s", METADATA_CATEGORIES)
 WHISPER_MODEL = "large"
 logger.debug("WHISPER_MODEL set to '%s'", WHISPER_MODEL)
 
+# How many transcripts are formatted at once; keep it low to respect the Gemini quota.
+FORMAT_CONCURRENCY = 4
+logger.debug("FORMAT_CONCURRENCY set to %s", FORMAT_CONCURRENCY)
+
 _spinner_styles = [
     "aesthetic"
     "arc"
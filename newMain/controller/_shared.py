@@ -0,0 +1,156 @@
+"""Objects shared by the menu controllers."""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from rich.console import Console, Group
+from rich.prompt import Prompt
+from rich.rule import Rule
+from rich.table import Table
+from rich.text import Text
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+# One Console for every menu: terminal probing happens once, and output from
+# different controllers goes through the same writer.
+console = Console()
+
+# Below this many items blocking file checks run inline; thread startup would cost
+# more than overlapping the stat calls saves.
+_MIN_PARALLEL_BATCH = 8
+_IO_WORKERS = 16
+
+
+def parallel_map(func, items):
+    """
+    Returns [func(item) for item in items], run on a thread pool when the batch is
+    large enough for overlapping the blocking file I/O to pay off.
+    """
+    items = list(items)
+    if len(items) < _MIN_PARALLEL_BATCH:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(_IO_WORKERS, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+class OptionsMenu:
+    """
+    Base for the simple option menus. Subclasses set the titles, fill
+    self.options ({key: {"desc": ..., "func": ...}}, with func None for the
+    exit/back entry) and call _init_menu(); run() then loops on the prompt.
+
+    Everything the loop needs (the table, heading, prompt and dispatch map) is
+    built once in _init_menu() rather than on every pass.
+    """
+
+    menu_title = "Menu"
+    table_title = "Available Options"
+
+    __slots__ = (
+        "console",
+        "options",
+        "_rendered_rows",
+        "_menu_table",
+        "_menu_frame",
+        "_prompt_text",
+        "_dispatch",
+        "_choices",
+    )
+
+    def _init_menu(self):
+        """Builds the menu renderables and dispatch map from self.options."""
+        self.console = console
+        # Row cells as Text, so building or rebuilding the table parses no markup.
+        self._rendered_rows = [
+            (Text(key), Text(option["desc"])) for key, option in self.options.items()
+        ]
+        self._menu_table = self._build_table()
+        self._menu_frame = Group(
+            Rule(Text(self.menu_title, style="bold blue")), self._menu_table
+        )
+        # Parsed once; Prompt.ask takes the Text as-is instead of re-parsing markup.
+        self._prompt_text = Text.from_markup(
+            "[bold yellow]Select an option[/bold yellow]"
+        )
+        # Flat (desc, func) per key for dispatch; self.options stays the source.
+        self._dispatch = {
+            key: (option["desc"], option["func"])
+            for key, option in self.options.items()
+        }
+        self._choices = list(self._dispatch)
+
+    def _build_table(self):
+        """
+        Builds the menu table from self._rendered_rows; refresh both if the options
+        change.
+        """
+        table = Table(
+            title=self.table_title,
+            show_header=True,
+            header_style="bold magenta",
+            box=config.BOX_STYLE,
+            padding=(0, 2),
+        )
+        table.add_column("Option", style="cyan", width=8)
+        table.add_column("Action", style="green")
+
+        for row in self._rendered_rows:
+            table.add_row(*row)
+        return table
+
+    def _redraw_menu(self):
+        """Clears the screen and prints the heading and table in a single write."""
+        self.console.clear()
+        self.console.print(self._menu_frame)
+
+    def _on_exit(self):
+        """Called when the user picks the exit/back entry."""
+        logger.info("Exiting %s. User selected 'Back'.", self.menu_title)
+
+    def run(self):
+        """Displays the menu and routes each choice to its handler."""
+        logger.info("%s started. Displaying menu.", self.menu_title)
+        # Checked once so per-keypress info logging costs nothing when it's off.
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        # Loop-invariant attributes, bound once.
+        console = self.console
+        redraw_menu = self._redraw_menu
+        prompt_text = self._prompt_text
+        choices = self._choices
+        dispatch = self._dispatch
+        while True:
+            redraw_menu()
+
+            # Rich re-asks on anything that isn't a menu key, so choice is always valid.
+            choice = Prompt.ask(
+                prompt_text,
+                choices=choices,
+                show_choices=False,
+                console=console,
+            ).strip()
+            if info_enabled:
+                logger.info("User selected option: '%s'", choice)
+            desc, action_func = dispatch[choice]
+
+            if action_func is None:
+                self._on_exit()
+                break
+
+            if info_enabled:
+                logger.info("Executing %s action: '%s'", self.menu_title, desc)
+            try:
+                action_func()
+            except Exception:
+                logger.critical(
+                    "An unhandled error occurred while running '%s' in %s.",
+                    desc,
+                    self.menu_title,
+                    exc_info=True,
+                )
+                # Message and pause go out as one prompt.
+                console.input(
+                    f"[bold red]An unexpected error occurred while running '{desc}'. Check logs for details.[/bold red]\n"
+                    "Press Enter to continue..."
+                )
@@ -1,5 +1,4 @@
 import logging
-from rich.console import Console
 from rich.table import Table
 from rich.prompt import Prompt
 from sqlalchemy.orm import joinedload
@@ -11,6 +10,7 @@ from database.models import JobInfo, VideoInfo, JobStage, StageState
 from services.chapter_builder import ChapterBuilder
 from services.metadata_extractor import MetadataExtractor  # Import MetadataExtractor
 from config import config
+from controller._shared import console
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +28,7 @@ class ChapterBuilderMenu:
         Initializes the ChapterBuilderMenu with console instance and menu options.
         Each option maps a display string to a corresponding handler method.
         """
-        self.console = Console()
+        self.console = console
         self.options = {
             "1": {
                 "desc": "Build chapter for single job (if missing)",
@@ -535,26 +535,26 @@ class ChapterBuilderMenu:
                 self.console.input("Press Enter to continue...")
                 continue
 
-            action_func = selected_option.get("func")
+            desc, action_func = selected_option["desc"], selected_option["func"]
 
             if action_func is None:
                 logger.info("Exiting Chapter Builder Menu. User selected 'Back'.")
                 break
 
-            self.console.print(f"[cyan]Executing:[/cyan] {selected_option.get('desc')}")
+            self.console.print(f"[cyan]Executing:[/cyan] {desc}")
             logger.info(
                 "Executing Chapter Builder Menu action: '%s'",
-                selected_option.get("desc"),
+                desc,
             )
             try:
                 action_func()
             except Exception:
                 logger.critical(
-                    f"An unhandled error occurred while running '{selected_option.get('desc')}' in Chapter Builder Menu.",
+                    f"An unhandled error occurred while running '{desc}' in Chapter Builder Menu.",
                     exc_info=True,
                 )
                 self.console.print(
-                    f"[bold red]An unexpected error occurred while running '{selected_option.get('desc')}'. Check logs for details.[/bold red]"
+                    f"[bold red]An unexpected error occurred while running '{desc}'. Check logs for details.[/bold red]"
                 )
                 self.console.input("Press Enter to continue...")
 
@@ -1,22 +1,236 @@
 import logging
-from rich.console import Console
+from rich.console import Group
+from rich.rule import Rule
 from rich.table import Table
 from rich.prompt import Prompt
-from sqlalchemy.orm import joinedload
-from pathlib import Path
+from sqlalchemy import func, select
+from operator import attrgetter
+from typing import NamedTuple
+import codecs
+import functools
 import json
+import os
+import time
 
 from database.session_manager import get_session
 from database.models import JobInfo, VideoInfo, JobStage, StageState
-from services.editor import Editor
+from services.editor import Editor, UNEDITED_MARKERS
 from config import config
+from controller._shared import console, parallel_map
 
 logger = logging.getLogger(__name__)
 
+# Cached eligible job lists are reused for at most this long, even if the
+# job_stage table looks unchanged, since files on disk can change under them.
+_ELIGIBLE_CACHE_TTL_SECONDS = 30
+
+# paragraphs.json is streamed in chunks of this many bytes, so an early unedited
+# entry answers the "needs editing" check without reading the rest of the file.
+_PARAGRAPHS_READ_SIZE = 65536
+
+
+def _entry_needs_editing(entry):
+    """Returns True if a paragraph entry still needs to be sent for editing."""
+    return entry.get("edited") in UNEDITED_MARKERS
+
+
+def _paragraphs_need_editing(paragraph_file_path):
+    """
+    Checks whether a paragraphs.json file has any entry still needing editing.
+
+    Streams the array with _iter_json_array and stops reading as soon as an
+    unedited entry is seen, so the common case only touches the first chunk.
+    Raises json.JSONDecodeError if the file is not a valid JSON array.
+    """
+    fd = os.open(paragraph_file_path, os.O_RDONLY)
+    try:
+        return any(_entry_needs_editing(entry) for entry in _iter_json_array(fd))
+    finally:
+        os.close(fd)
+
+
+def _iter_json_array(fd):
+    """
+    Yields the entries of the top-level JSON array in the file open on fd,
+    reading _PARAGRAPHS_READ_SIZE bytes at a time only as the entries are consumed.
+    """
+    decoder = json.JSONDecoder()
+    # The incremental decoder holds back a multi-byte character cut off at a chunk edge.
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buffer, pos, at_eof = "", 0, False
+
+    def read_more():
+        nonlocal buffer, pos, at_eof
+        chunk = os.read(fd, _PARAGRAPHS_READ_SIZE)
+        at_eof = not chunk
+        buffer = buffer[pos:] + utf8.decode(chunk, final=at_eof)
+        pos = 0
+
+    started = False
+    seen_entry = False
+    expect_entry = True
+    while True:
+        pos = _skip_whitespace(buffer, pos)
+        if pos == len(buffer):
+            if at_eof:
+                raise json.JSONDecodeError("Unexpected end of data", buffer, pos)
+            read_more()
+            continue
+
+        char = buffer[pos]
+        if not started:
+            if char != "[":
+                raise json.JSONDecodeError("Expecting '['", buffer, pos)
+            started = True
+            pos += 1
+        elif char == "]" and (not expect_entry or not seen_entry):
+            return
+        elif expect_entry:
+            try:
+                entry, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if at_eof:
+                    raise
+                read_more()  # The entry is cut off by the end of the buffer.
+                continue
+            pos = end
+            seen_entry = True
+            expect_entry = False
+            yield entry
+        elif char == ",":
+            pos += 1
+            expect_entry = True
+        else:
+            raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+
+
+def _stage_table_fingerprint(session):
+    """
+    Returns a cheap row-count fingerprint of the job_stage table. It catches new
+    stages; a state change on an existing stage shows up once the cache TTL runs out.
+    """
+    return session.query(func.count(JobStage.id)).scalar()
+
+
+def _query_format_gemini_success_jobs(extra_columns, *criteria):
+    """
+    Builds the shared select for jobs whose 'format_gemini' stage succeeded, joined
+    once to VideoInfo and JobStage. Every row carries job_id, job_ulid and title,
+    plus extra_columns; criteria are ANDed onto the base filter.
+    """
+    return (
+        select(
+            JobInfo.id.label("job_id"),
+            JobInfo.job_ulid.label("job_ulid"),
+            VideoInfo.title.label("title"),
+            *extra_columns,
+        )
+        .join(VideoInfo, JobInfo.video_id == VideoInfo.id)
+        .join(JobStage, JobInfo.id == JobStage.job_id)
+        .where(
+            JobStage.stage_name == "format_gemini",
+            JobStage.state == StageState.success,
+            *criteria,
+        )
+    )
+
+
+def _render_menu(heading, title, options):
+    """
+    Builds a menu screen (heading rule plus Option/Action table) as one Group.
+    Menu options never change at runtime, so callers build this once and reprint it.
+    """
+    table = Table(
+        title=title,
+        show_header=True,
+        header_style="bold magenta",
+        box=config.BOX_STYLE,
+        padding=(0, 2),
+    )
+    table.add_column("Option", style="cyan", width=8)
+    table.add_column("Action", style="green")
+    for key, val in options.items():
+        table.add_row(key, val["desc"])
+    return Group(Rule(heading), table)
+
+
+def _selection_table(title, column_specs):
+    """
+    Builds an empty numbered selection table.
+    `column_specs` is a sequence of (header, style) pairs.
+    """
+    table = Table(
+        title=title,
+        show_header=True,
+        header_style="bold magenta",
+        box=config.BOX_STYLE,
+        padding=(0, 2),
+    )
+    table.add_column("No.", style="cyan", width=5)
+    for header, style in column_specs:
+        table.add_column(header, style=style)
+    return table
+
+
+def _stat_or_none(path):
+    """Returns os.stat(path), or None if the path does not exist."""
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _batch_stat(paths):
+    """Stats all paths up front and returns a {path: stat_result or None} dict."""
+    paths = list(dict.fromkeys(paths))
+    return dict(zip(paths, parallel_map(_stat_or_none, paths)))
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_needs_editing(paragraph_file_path: str, mtime_bucket: int) -> bool:
+    """
+    Memoized _paragraphs_need_editing, keyed on the file's path and mtime so
+    repeat menu visits skip the read and parse until the file is rewritten.
+    """
+    return _paragraphs_need_editing(paragraph_file_path)
+
+
+def _skip_whitespace(text, idx):
+    """Returns the index of the next non-whitespace character in text."""
+    while idx < len(text) and text[idx] in " \t\n\r":
+        idx += 1
+    return idx
+
+
+class EligibleJob(NamedTuple):
+    """One row of an eligible-jobs listing; only the path relevant to the listing is set."""
+
+    id: int
+    job_ulid: str
+    title: str
+    output_path: str | None = None
+    paragraph_json_path: str | None = None
+
+
+# (header, style, getter) specs for the job selection tables.
+_JSON_BUILD_COLUMNS = (
+    ("Job ULID", "green", attrgetter("job_ulid")),
+    ("Title", "green", attrgetter("title")),
+    ("Formatted Transcript Path", "dim", lambda job: job.output_path or "N/A"),
+)
+_PARAGRAPH_EDIT_COLUMNS = (
+    ("Job ULID", "green", attrgetter("job_ulid")),
+    ("Title", "green", attrgetter("title")),
+    ("Paragraph JSON Path", "dim", lambda job: job.paragraph_json_path or "N/A"),
+)
+
 
 class EditorMenu:
+    # Rows shown per page in the job selection tables.
+    _PAGE_SIZE = 25
+
     def __init__(self):
-        self.console = Console()
+        self.console = console
         self.options = {
             "1": {
                 "desc": "Build Paragraph JSON for single job",
@@ -32,6 +246,34 @@ class EditorMenu:
             },
             "b": {"desc": "Back to Main Menu", "func": None},
         }
+        self._edit_options = {
+            "1": {
+                "desc": "Process a single job for editing",
+                "func": self._select_and_process_single_edited_job,
+            },
+            "2": {
+                "desc": "Process all eligible jobs for editing",
+                "func": self._process_all_edited_jobs,
+            },
+            "b": {"desc": "Back to Editor Menu", "func": None},
+        }
+        # Fully built menu screens, reprinted as-is on every redraw.
+        self._rendered_main_menu = _render_menu(
+            "[bold blue]Editor Menu[/bold blue]", "Editor Options", self.options
+        )
+        self._rendered_edit_menu = _render_menu(
+            "[bold blue]Paragraph Editing Menu[/bold blue]",
+            "Paragraph Editing Options",
+            self._edit_options,
+        )
+        # Eligible job lists, keyed by "json_build" / "paragraphs_edit", cached for
+        # the lifetime of one menu run and dropped whenever a job's state changes.
+        self._eligible_cache: dict[str, list] = {}
+        # IDs of the jobs in each cached list, so a processed job can be dropped
+        # without re-querying.
+        self._eligible_ids: dict[str, set] = {}
+        # (job_stage fingerprint, monotonic time) each cached list was built at.
+        self._eligible_fingerprints: dict[str, tuple] = {}
         logger.debug("EditorMenu initialized with options: %s", self.options)
 
     def _select_and_build_paragraph_json_for_single_job(self):
@@ -40,20 +282,23 @@ class EditorMenu:
         selected_job_data = self._get_selected_sermon_for_json_build()
         if selected_job_data:
             self.console.print(
-                f"[cyan]Selected Job:[/cyan] {selected_job_data['job_ulid']} - [dim]{selected_job_data['title']}[/dim]"
+                f"[cyan]Selected Job:[/cyan] {selected_job_data.job_ulid} - [dim]{selected_job_data.title}[/dim]"
             )
             logger.info(
-                f"User selected Job ULID: {selected_job_data['job_ulid']} (ID: {selected_job_data['id']}) for single paragraph JSON build."
+                f"User selected Job ULID: {selected_job_data.job_ulid} (ID: {selected_job_data.id}) for single paragraph JSON build."
             )
             try:
-                editor_service = Editor(job_id=selected_job_data["id"])
-                editor_service.run_editor()  # This method builds the JSON
+                editor_service = Editor(job_id=selected_job_data.id)
+                # This method builds the JSON; a job it skipped stays eligible.
+                if editor_service.run_editor():
+                    self._discard_eligible_job("json_build", selected_job_data.id)
+                    self._drop_eligible_jobs("paragraphs_edit")
                 logger.info(
-                    f"Successfully ran editor for Job ULID: {selected_job_data['job_ulid']}."
+                    f"Successfully ran editor for Job ULID: {selected_job_data.job_ulid}."
                 )
             except Exception:
                 logger.error(
-                    f"Error building paragraph JSON for Job ULID: {selected_job_data['job_ulid']}.",
+                    f"Error building paragraph JSON for Job ULID: {selected_job_data.job_ulid}.",
                     exc_info=True,
                 )
         else:
@@ -63,11 +308,65 @@ class EditorMenu:
             )
         self.console.input("Press Enter to continue...")
 
+    def _invalidate_eligible_cache(self):
+        """Drops all cached eligible job lists so the next lookup re-queries."""
+        self._eligible_cache.clear()
+        self._eligible_ids.clear()
+        self._eligible_fingerprints.clear()
+
+    def _drop_eligible_jobs(self, key):
+        """Drops the cached job list for key so the next lookup re-queries."""
+        self._eligible_cache.pop(key, None)
+        self._eligible_ids.pop(key, None)
+        self._eligible_fingerprints.pop(key, None)
+
+    def _get_cached_eligible_jobs(self, key, fingerprint):
+        """
+        Returns the cached job list for key, or None if it must be re-queried because
+        it is empty, older than the TTL, or the job_stage fingerprint has changed.
+        """
+        if not self._eligible_ids.get(key):
+            return None
+        cached_fingerprint, cached_at = self._eligible_fingerprints.get(key, (None, 0))
+        if cached_fingerprint != fingerprint:
+            return None
+        if time.monotonic() - cached_at > _ELIGIBLE_CACHE_TTL_SECONDS:
+            return None
+        return self._eligible_cache.get(key)
+
+    def _cache_eligible_jobs(self, key, jobs_list, fingerprint):
+        """Caches a freshly queried job list along with its set of job IDs."""
+        eligible_ids = {job.id for job in jobs_list}
+        # The (job_id, stage_name) unique constraint on job_stage means the single
+        # format_gemini join can't yield a job twice. If that ever changes, keep the
+        # first row per job so the list and the ID set still match.
+        if len(eligible_ids) != len(jobs_list):
+            logger.warning(
+                "Duplicate jobs in eligible list '%s'; keeping one row per job.", key
+            )
+            first_rows = {}
+            for job in jobs_list:
+                first_rows.setdefault(job.id, job)
+            jobs_list[:] = first_rows.values()
+        self._eligible_cache[key] = jobs_list
+        self._eligible_ids[key] = eligible_ids
+        self._eligible_fingerprints[key] = (fingerprint, time.monotonic())
+
+    def _discard_eligible_job(self, key, job_id):
+        """Removes a processed job from the cached list for key."""
+        eligible_ids = self._eligible_ids.get(key)
+        if eligible_ids is None:
+            return
+        eligible_ids.discard(job_id)
+        self._eligible_cache[key] = [
+            job for job in self._eligible_cache.get(key, []) if job.id in eligible_ids
+        ]
+
     def _get_selected_sermon_for_json_build(self):
         """
         Displays a list of jobs that have completed the 'format_gemini' stage
         and allows the user to select one for building paragraph JSON.
-        Returns a dictionary containing the selected job's information or None if no selection is made.
+        Returns the selected EligibleJob, or None if no selection is made.
         """
         logger.debug("Displaying sermons for paragraph JSON build selection.")
         self.console.clear()
@@ -87,108 +386,139 @@ class EditorMenu:
             )
             return None
 
-        table = Table(
-            title="Available Sermons for Paragraph JSON Build",
-            show_header=True,
-            header_style="bold magenta",
-            box=config.BOX_STYLE,
-            padding=(0, 2),
+        selected_job_data = self._pick_from_table(
+            jobs_for_editing,
+            "Available Sermons for Paragraph JSON Build",
+            _JSON_BUILD_COLUMNS,
         )
-        table.add_column("No.", style="cyan", width=5)
-        table.add_column("Job ULID", style="green")
-        table.add_column("Title", style="green")
-        table.add_column("Formatted Transcript Path", style="dim")
-
-        job_map = {}
-        for i, job_data in enumerate(jobs_for_editing):
-            display_num = str(i + 1)
-            job_map[display_num] = job_data
-            table.add_row(
-                display_num,
-                job_data["job_ulid"],
-                job_data["title"],
-                job_data["output_path"] if job_data["output_path"] else "N/A",
-            )
+        if selected_job_data is None:
+            logger.info("User opted to go back from paragraph JSON build selection.")
+            return None
+
+        logger.debug(
+            f"Returning selected job data for ULID: {selected_job_data.job_ulid}"
+        )
+        return selected_job_data
 
-        self.console.print(table)
+    def _pick_from_table(self, rows, title, columns):
+        """
+        Displays rows in a numbered table, _PAGE_SIZE at a time, and prompts the user
+        to pick one by number or page with 'n'/'p'.
+        `columns` is a sequence of (header, style, getter) tuples, where getter
+        takes a row and returns the cell text.
+        Returns the selected row, or None if the user chooses to go back.
+        """
+        column_specs = [(header, style) for header, style, _ in columns]
+        page_count = max(1, -(-len(rows) // self._PAGE_SIZE))
+        page_start = 0
 
         while True:
-            choice = (
-                Prompt.ask(
-                    "[bold yellow]Select a sermon by number (or 'b' to go back)[/bold yellow]"
-                )
-                .strip()
-                .lower()
-            )
-            logger.debug("User selected: '%s'", choice)
-            if choice == "b":
-                logger.info(
-                    "User opted to go back from paragraph JSON build selection."
+            table = _selection_table(title, column_specs)
+            if page_count > 1:
+                table.caption = (
+                    f"Page {page_start // self._PAGE_SIZE + 1} of {page_count}"
                 )
-                return None
 
-            selected_job_data = job_map.get(choice)
-            if selected_job_data:
-                logger.debug(
-                    f"Returning selected job data for ULID: {selected_job_data['job_ulid']}"
-                )
-                return selected_job_data
-            else:
-                logger.warning(
-                    "Invalid selection for paragraph JSON build: '%s'", choice
+            # Numbers are absolute positions in `rows`, so they stay stable across pages.
+            row_map = {}
+            page_rows = rows[page_start : page_start + self._PAGE_SIZE]
+            for i, row in enumerate(page_rows, start=page_start + 1):
+                display_num = str(i)
+                row_map[display_num] = row
+                table.add_row(display_num, *(getter(row) for _, _, getter in columns))
+
+            self.console.print(table)
+
+            prompt_text = "Select a sermon by number (or 'b' to go back)"
+            if page_count > 1:
+                prompt_text = "Select a sermon by number ('n'/'p' for next/previous page, 'b' to go back)"
+
+            while True:
+                choice = (
+                    Prompt.ask(f"[bold yellow]{prompt_text}[/bold yellow]")
+                    .strip()
+                    .lower()
                 )
+                logger.debug("User selected: '%s'", choice)
+                if choice == "b":
+                    return None
+
+                if choice == "n" and page_start + self._PAGE_SIZE < len(rows):
+                    page_start += self._PAGE_SIZE
+                    break
+                if choice == "p" and page_start > 0:
+                    page_start -= self._PAGE_SIZE
+                    break
+
+                selected_row = row_map.get(choice)
+                if selected_row:
+                    return selected_row
+
+                logger.warning("Invalid selection in '%s': '%s'", title, choice)
                 self.console.print(
-                    "[red]Invalid selection. Please enter a valid number or 'b'.[/red]"
+                    "[red]Invalid selection. Please enter a number from this page, 'n', 'p' or 'b'.[/red]"
+                    if page_count > 1
+                    else "[red]Invalid selection. Please enter a valid number or 'b'.[/red]"
                 )
 
     def _get_eligible_jobs_for_json_build(self):
         """
         Queries the database for jobs that have successfully completed the 'format_gemini' stage
         and either have no paragraph JSON path or the file at that path does not exist.
-        Returns a list of dictionaries, each containing relevant job information.
+        Returns a list of EligibleJob tuples.
         """
         logger.debug("Querying for eligible jobs for paragraph JSON build.")
         jobs_list = []
         try:
             with get_session() as session:
-                jobs_query_results = (
-                    session.query(
-                        JobInfo.id.label("job_id"),
-                        JobInfo.job_ulid.label("job_ulid"),
-                        JobInfo.job_directory.label("job_directory"),
-                        VideoInfo.title.label("title"),
+                fingerprint = _stage_table_fingerprint(session)
+                cached_jobs = self._get_cached_eligible_jobs("json_build", fingerprint)
+                if cached_jobs is not None:
+                    logger.debug("Using cached eligible jobs for paragraph JSON build.")
+                    return cached_jobs
+
+                stmt = _query_format_gemini_success_jobs(
+                    [
                         JobStage.output_path.label("output_path"),
                         JobStage.paragraph_json_path.label("paragraph_json_path"),
-                    )
-                    .join(VideoInfo, JobInfo.video_id == VideoInfo.id)
-                    .join(JobStage, JobInfo.id == JobStage.job_id)
-                    .filter(
-                        JobStage.stage_name == "format_gemini",
-                        JobStage.state == StageState.success,
-                    )
-                ).all()
+                    ]
+                )
+                # Plain row mappings; no ORM objects are needed for a read-only listing.
+                jobs_query_results = session.execute(stmt).mappings().all()
                 logger.debug(
                     f"Found {len(jobs_query_results)} candidate jobs from DB query."
                 )
 
+                # Only rows that have a path need a disk check.
+                path_stats = _batch_stat(
+                    job["paragraph_json_path"]
+                    for job in jobs_query_results
+                    if job["paragraph_json_path"]
+                )
+
                 for job in jobs_query_results:
+                    # The disk is the source of truth: a recorded paragraphs.json can
+                    # still have been deleted since it was written.
                     paragraph_file_exists = False
-                    if job.paragraph_json_path:
-                        paragraph_file_exists = Path(job.paragraph_json_path).exists()
+                    if job["paragraph_json_path"]:
+                        paragraph_file_exists = (
+                            path_stats[job["paragraph_json_path"]] is not None
+                        )
 
-                    if job.paragraph_json_path is None or not paragraph_file_exists:
+                    if not paragraph_file_exists:
                         jobs_list.append(
-                            {
-                                "id": job.job_id,
-                                "job_ulid": job.job_ulid,
-                                "title": job.title,
-                                "output_path": job.output_path,
-                                "job_directory": job.job_directory,
-                            }
+                            EligibleJob(
+                                id=job["job_id"],
+                                job_ulid=job["job_ulid"],
+                                title=job["title"],
+                                output_path=job["output_path"],
+                            )
                         )
+
             logger.info(
                 f"Identified {len(jobs_list)} eligible jobs for paragraph JSON build."
             )
+            self._cache_eligible_jobs("json_build", jobs_list, fingerprint)
         except Exception:
             logger.error(
                 "Error querying for eligible jobs for paragraph JSON build.",
@@ -221,29 +551,35 @@ class EditorMenu:
         logger.info(
             f"Found {len(eligible_jobs)} eligible jobs for bulk paragraph JSON build."
         )
-        for i, job_data in enumerate(eligible_jobs):
+        self._run_editor_for_jobs(
+            eligible_jobs,
+            Editor.run_editor,
+            "Successfully ran editor for Job ULID: %s (ID: %s).",
+            "Error building paragraph JSON for Job ULID: %s.",
+        )
+
+        self._invalidate_eligible_cache()
+        self.console.print("\n[green]Finished processing all eligible jobs.[/green]")
+        logger.info("Finished bulk paragraph JSON build for all eligible jobs.")
+        self.console.input("Press Enter to continue...")
+
+    def _run_editor_for_jobs(self, jobs, editor_method, success_message, error_message):
+        """
+        Runs `editor_method` (an unbound Editor method) for each job, printing a
+        header before each one. A failed job is logged and the run moves on.
+        """
+        total = len(jobs)
+        for i, job_data in enumerate(jobs):
+            # One write per job: the blank separator line rides along with the next header.
+            separator = "\n" if i else ""
             self.console.print(
-                f"[bold white]Processing Job ({i+1}/{len(eligible_jobs)}):[/bold white] {job_data['job_ulid']} - {job_data['title']}"
-            )
-            logger.info(
-                f"Processing Job ({i+1}/{len(eligible_jobs)}): Job ULID: {job_data['job_ulid']} (ID: {job_data['id']})"
+                f"{separator}[bold white]Processing Job ({i+1}/{total}):[/bold white] {job_data.job_ulid} - {job_data.title}"
             )
             try:
-                editor_service = Editor(job_id=job_data["id"])
-                editor_service.run_editor()
-                logger.info(
-                    f"Successfully ran editor for Job ULID: {job_data['job_ulid']}."
-                )
+                editor_method(Editor(job_id=job_data.id))
+                logger.info(success_message, job_data.job_ulid, job_data.id)
             except Exception:
-                logger.error(
-                    f"Error building paragraph JSON for Job ULID: {job_data['job_ulid']}.",
-                    exc_info=True,
-                )
-            self.console.print()
-
-        self.console.print("[green]Finished processing all eligible jobs.[/green]")
-        logger.info("Finished bulk paragraph JSON build for all eligible jobs.")
-        self.console.input("Press Enter to continue...")
+                logger.error(error_message, job_data.job_ulid, exc_info=True)
 
     # --- New methods for paragraph editing ---
     def _run_paragraph_editing_menu(self):
@@ -251,34 +587,8 @@ class EditorMenu:
         logger.info("Entering Paragraph Editing Sub-Menu.")
         while True:
             self.console.clear()
-            self.console.rule("[bold blue]Paragraph Editing Menu[/bold blue]")
-
-            options = {
-                "1": {
-                    "desc": "Process a single job for editing",
-                    "func": self._select_and_process_single_edited_job,
-                },
-                "2": {
-                    "desc": "Process all eligible jobs for editing",
-                    "func": self._process_all_edited_jobs,
-                },
-                "b": {"desc": "Back to Editor Menu", "func": None},
-            }
-
-            table = Table(
-                title="Paragraph Editing Options",
-                show_header=True,
-                header_style="bold magenta",
-                box=config.BOX_STYLE,
-                padding=(0, 2),
-            )
-            table.add_column("Option", style="cyan", width=8)
-            table.add_column("Action", style="green")
-
-            for key, val in options.items():
-                table.add_row(key, val["desc"])
-
-            self.console.print(table)
+            self.console.print(self._rendered_edit_menu)
+            options = self._edit_options
 
             choice = (
                 Prompt.ask("[bold yellow]Select an option[/bold yellow]")
@@ -299,26 +609,26 @@ class EditorMenu:
                 self.console.input("Press Enter to continue...")
                 continue
 
-            action_func = selected_option.get("func")
+            desc, action_func = selected_option["desc"], selected_option["func"]
 
             if action_func is None:
                 logger.info("Exiting Paragraph Editing Menu. User selected 'Back'.")
                 break
 
-            self.console.print(f"[cyan]Executing:[/cyan] {selected_option.get('desc')}")
+            self.console.print(f"[cyan]Executing:[/cyan] {desc}")
             logger.info(
                 "Executing Paragraph Editing Menu action: '%s'",
-                selected_option.get("desc"),
+                desc,
             )
             try:
                 action_func()
             except Exception:
                 logger.critical(
-                    f"An unhandled error occurred while running '{selected_option.get('desc')}' in Paragraph Editing Menu.",
+                    f"An unhandled error occurred while running '{desc}' in Paragraph Editing Menu.",
                     exc_info=True,
                 )
                 self.console.print(
-                    f"[bold red]An unexpected error occurred while running '{selected_option.get('desc')}'. Check logs for details.[/bold red]"
+                    f"[bold red]An unexpected error occurred while running '{desc}'. Check logs for details.[/bold red]"
                 )
                 self.console.input("Press Enter to continue...")
 
@@ -329,103 +639,48 @@ class EditorMenu:
         """
         Queries the database for jobs that have a 'format_gemini' stage completed,
         and whose paragraphs.json file either does not exist, or contains 'edited: None' entries.
-        Returns a list of dictionaries, each containing relevant job information.
+        Returns a list of EligibleJob tuples.
         """
         logger.debug("Querying for jobs with paragraphs needing editing.")
         jobs_list = []
         try:
             with get_session() as session:
-                successful_format_gemini_jobs = (
-                    session.query(JobStage.job_id)
-                    .filter(
-                        JobStage.stage_name == "format_gemini",
-                        JobStage.state == StageState.success,
-                    )
-                    .subquery()
+                fingerprint = _stage_table_fingerprint(session)
+                cached_jobs = self._get_cached_eligible_jobs(
+                    "paragraphs_edit", fingerprint
                 )
-                logger.debug("Subquery for successful 'format_gemini' jobs executed.")
-
-                candidate_jobs_query = (
-                    session.query(
-                        JobInfo.id.label("job_id"),
-                        JobInfo.job_ulid.label("job_ulid"),
-                        JobInfo.job_directory.label("job_directory"),
-                        VideoInfo.title.label("title"),
-                        JobStage.paragraph_json_path.label("paragraph_json_path"),
-                    )
-                    .join(VideoInfo, JobInfo.video_id == VideoInfo.id)
-                    .join(JobStage, JobInfo.id == JobStage.job_id)
-                    .filter(
-                        JobInfo.id == successful_format_gemini_jobs.c.job_id,
-                        JobStage.stage_name == "format_gemini",
-                    )
-                ).all()
+                if cached_jobs is not None:
+                    logger.debug("Using cached jobs with paragraphs needing editing.")
+                    return cached_jobs
+
+                # Every format_gemini job is a candidate; jobs whose paragraphs.json
+                # is missing are listed with a warning by _classify_job_for_editing.
+                stmt = _query_format_gemini_success_jobs(
+                    [JobInfo.job_directory.label("job_directory")]
+                )
+                candidate_jobs_query = session.execute(stmt).all()
                 logger.debug(
                     f"Found {len(candidate_jobs_query)} candidate jobs from DB query for editing eligibility."
                 )
 
-                for job_data in candidate_jobs_query:
-                    job_directory = Path(job_data.job_directory)
-                    paragraph_file_path = job_directory / config.PARAGRAPHS_FILE_NAME
-
-                    needs_editing_processing = False
-
-                    if not paragraph_file_path.exists():
-                        logger.warning(
-                            f"Paragraph JSON file for job {job_data.job_ulid} does not exist at {paragraph_file_path}. Marking as eligible for processing."
-                        )
-                        self.console.print(
-                            f"[yellow]Warning: Paragraph JSON file for job {job_data.job_ulid} does not exist at {paragraph_file_path}. Marking as eligible for processing.[/yellow]"
-                        )
-                        needs_editing_processing = True
-                    else:
-                        try:
-                            with open(paragraph_file_path, "r") as f:
-                                paragraphs_data = json.load(f)
-
-                            for entry in paragraphs_data:
-                                if (
-                                    entry.get("edited") is None
-                                    or entry.get("edited")
-                                    == "[ERROR] - See logs for details."
-                                ):
-                                    needs_editing_processing = True
-                                    logger.debug(
-                                        f"Job {job_data.job_ulid} has unedited paragraphs."
-                                    )
-                                    break
-                        except json.JSONDecodeError as e:
-                            logger.error(
-                                f"Error decoding JSON for job {job_data.job_ulid} at {paragraph_file_path}: {e}. Marking as eligible.",
-                                exc_info=True,
-                            )
-                            self.console.print(
-                                f"[red]Error decoding JSON for job {job_data.job_ulid} at {paragraph_file_path}: {e}. Marking as eligible.[/red]"
-                            )
-                            needs_editing_processing = True
-                        except Exception as e:
-                            logger.error(
-                                f"Error reading paragraph JSON for job {job_data.job_ulid} at {paragraph_file_path}: {e}. Marking as eligible.",
-                                exc_info=True,
-                            )
-                            self.console.print(
-                                f"[red]Error reading paragraph JSON for job {job_data.job_ulid} at {paragraph_file_path}: {e}. Marking as eligible.[/red]"
-                            )
-                            needs_editing_processing = True
+                # Each job's stat + parse runs on the pool; console warnings are
+                # collected and printed afterwards so Rich output isn't interleaved.
+                classify_job = functools.partial(
+                    self._classify_job_for_editing,
+                    paragraphs_file_name=config.PARAGRAPHS_FILE_NAME,
+                )
+                for eligible_job, warning in parallel_map(
+                    classify_job, candidate_jobs_query
+                ):
+                    if warning:
+                        self.console.print(warning)
+                    if eligible_job:
+                        jobs_list.append(eligible_job)
 
-                    if needs_editing_processing:
-                        jobs_list.append(
-                            {
-                                "id": job_data.job_id,
-                                "job_ulid": job_data.job_ulid,
-                                "title": job_data.title,
-                                "job_directory": job_data.job_directory,
-                                "paragraph_json_path": str(paragraph_file_path),
-                            }
-                        )
             logger.info(
                 f"Identified {len(jobs_list)} jobs with paragraphs needing editing."
             )
+            self._cache_eligible_jobs("paragraphs_edit", jobs_list, fingerprint)
         except Exception:
             logger.error(
                 "Error querying for jobs with paragraphs needing editing.",
@@ -433,6 +688,55 @@ class EditorMenu:
             )
         return jobs_list
 
+    def _classify_job_for_editing(self, job_data, paragraphs_file_name):
+        """
+        Checks one candidate job's paragraphs.json for entries still needing editing.
+        Safe to run on a worker thread: it does not touch the console, and instead
+        returns (EligibleJob or None, console warning or None).
+        """
+        # A plain string is all the stat/open/display below need.
+        paragraph_file_path = os.path.join(job_data.job_directory, paragraphs_file_name)
+        eligible_job = EligibleJob(
+            id=job_data.job_id,
+            job_ulid=job_data.job_ulid,
+            title=job_data.title,
+            paragraph_json_path=paragraph_file_path,
+        )
+
+        stat_result = _stat_or_none(paragraph_file_path)
+        if stat_result is None:
+            logger.warning(
+                f"Paragraph JSON file for job {job_data.job_ulid} does not exist at {paragraph_file_path}. Marking as eligible for processing."
+            )
+            return (
+                eligible_job,
+                f"[yellow]Warning: Paragraph JSON file for job {job_data.job_ulid} does not exist at {paragraph_file_path}. Marking as eligible for processing.[/yellow]",
+            )
+
+        try:
+            if _cached_needs_editing(paragraph_file_path, stat_result.st_mtime_ns):
+                logger.debug("Job %s has unedited paragraphs.", job_data.job_ulid)
+                return eligible_job, None
+        except json.JSONDecodeError as e:
+            logger.error(
+                f"Error decoding JSON for job {job_data.job_ulid} at {paragraph_file_path}: {e}. Marking as eligible.",
+                exc_info=True,
+            )
+            return (
+                eligible_job,
+                f"[red]Error decoding JSON for job {job_data.job_ulid} at {paragraph_file_path}: {e}. Marking as eligible.[/red]",
+            )
+        except Exception as e:
+            logger.error(
+                f"Error reading paragraph JSON for job {job_data.job_ulid} at {paragraph_file_path}: {e}. Marking as eligible.",
+                exc_info=True,
+            )
+            return (
+                eligible_job,
+                f"[red]Error reading paragraph JSON for job {job_data.job_ulid} at {paragraph_file_path}: {e}. Marking as eligible.[/red]",
+            )
+        return None, None
+
     def _select_and_process_single_edited_job(self):
         """
         Allows the user to select a single job that has a paragraphs.json file
@@ -455,78 +759,36 @@ class EditorMenu:
             self.console.input("Press Enter to continue...")
             return None
 
-        table = Table(
-            title="Available Sermons for Paragraph Editing",
-            show_header=True,
-            header_style="bold magenta",
-            box=config.BOX_STYLE,
-            padding=(0, 2),
+        selected_job_data = self._pick_from_table(
+            jobs_to_edit,
+            "Available Sermons for Paragraph Editing",
+            _PARAGRAPH_EDIT_COLUMNS,
         )
-        table.add_column("No.", style="cyan", width=5)
-        table.add_column("Job ULID", style="green")
-        table.add_column("Title", style="green")
-        table.add_column("Paragraph JSON Path", style="dim")
-
-        job_map = {}
-        for i, job_data in enumerate(jobs_to_edit):
-            display_num = str(i + 1)
-            job_map[display_num] = job_data
-            table.add_row(
-                display_num,
-                job_data["job_ulid"],
-                job_data["title"],
-                (
-                    job_data["paragraph_json_path"]
-                    if job_data["paragraph_json_path"]
-                    else "N/A"
-                ),
+        if selected_job_data is None:
+            logger.info(
+                "User opted to go back from single job paragraph editing selection."
             )
+            return None
 
-        self.console.print(table)
-
-        while True:
-            choice = (
-                Prompt.ask(
-                    "[bold yellow]Select a sermon by number (or 'b' to go back)[/bold yellow]"
-                )
-                .strip()
-                .lower()
+        self.console.print(
+            f"[cyan]Selected Job:[/cyan] {selected_job_data.job_ulid} - [dim]{selected_job_data.title}[/dim]"
+        )
+        logger.info(
+            f"User selected Job ULID: {selected_job_data.job_ulid} (ID: {selected_job_data.id}) for single paragraph editing."
+        )
+        try:
+            editor_service = Editor(job_id=selected_job_data.id)
+            editor_service.process_paragraphs_for_editing()
+            logger.info(
+                f"Successfully processed paragraphs for Job ULID: {selected_job_data.job_ulid}."
             )
-            logger.debug("User selected: '%s'", choice)
-            if choice == "b":
-                logger.info(
-                    "User opted to go back from single job paragraph editing selection."
-                )
-                return None
-
-            selected_job_data = job_map.get(choice)
-            if selected_job_data:
-                self.console.print(
-                    f"[cyan]Selected Job:[/cyan] {selected_job_data['job_ulid']} - [dim]{selected_job_data['title']}[/dim]"
-                )
-                logger.info(
-                    f"User selected Job ULID: {selected_job_data['job_ulid']} (ID: {selected_job_data['id']}) for single paragraph editing."
-                )
-                try:
-                    editor_service = Editor(job_id=selected_job_data["id"])
-                    editor_service.process_paragraphs_for_editing()
-                    logger.info(
-                        f"Successfully processed paragraphs for Job ULID: {selected_job_data['job_ulid']}."
-                    )
-                except Exception:
-                    logger.error(
-                        f"Error processing paragraphs for Job ULID: {selected_job_data['job_ulid']}.",
-                        exc_info=True,
-                    )
-                self.console.input("Press Enter to continue...")
-                return
-            else:
-                logger.warning(
-                    "Invalid selection for single job paragraph editing: '%s'", choice
-                )
-                self.console.print(
-                    "[red]Invalid selection. Please enter a valid number or 'b'.[/red]"
-                )
+        except Exception:
+            logger.error(
+                f"Error processing paragraphs for Job ULID: {selected_job_data.job_ulid}.",
+                exc_info=True,
+            )
+        self._drop_eligible_jobs("paragraphs_edit")
+        self.console.input("Press Enter to continue...")
 
     def _process_all_edited_jobs(self):
         """
@@ -555,27 +817,15 @@ class EditorMenu:
         logger.info(
             f"Found {len(jobs_to_edit)} jobs with paragraphs to edit for bulk processing."
         )
-        for i, job_data in enumerate(jobs_to_edit):
-            self.console.print(
-                f"[bold white]Processing Job ({i+1}/{len(jobs_to_edit)}):[/bold white] {job_data['job_ulid']} - {job_data['title']}"
-            )
-            logger.info(
-                f"Processing Job ({i+1}/{len(jobs_to_edit)}): Job ULID: {job_data['job_ulid']} (ID: {job_data['id']})"
-            )
-            try:
-                editor_service = Editor(job_id=job_data["id"])
-                editor_service.process_paragraphs_for_editing()
-                logger.info(
-                    f"Successfully processed paragraphs for Job ULID: {job_data['job_ulid']}."
-                )
-            except Exception:
-                logger.error(
-                    f"Error processing paragraphs for Job ULID: {job_data['job_ulid']}.",
-                    exc_info=True,
-                )
-            self.console.print()
+        self._run_editor_for_jobs(
+            jobs_to_edit,
+            Editor.process_paragraphs_for_editing,
+            "Successfully processed paragraphs for Job ULID: %s (ID: %s).",
+            "Error processing paragraphs for Job ULID: %s.",
+        )
 
-        self.console.print("[green]Finished processing all eligible jobs.[/green]")
+        self._drop_eligible_jobs("paragraphs_edit")
+        self.console.print("\n[green]Finished processing all eligible jobs.[/green]")
         logger.info("Finished bulk paragraph editing for all eligible jobs.")
         self.console.input("Press Enter to continue...")
 
@@ -584,24 +834,10 @@ class EditorMenu:
         Main entry point for the editor menu.
         """
         logger.info("Editor Menu started. Displaying menu.")
+        self._invalidate_eligible_cache()
         while True:
             self.console.clear()
-            self.console.rule("[bold blue]Editor Menu[/bold blue]")
-
-            table = Table(
-                title="Editor Options",
-                show_header=True,
-                header_style="bold magenta",
-                box=config.BOX_STYLE,
-                padding=(0, 2),
-            )
-            table.add_column("Option", style="cyan", width=8)
-            table.add_column("Action", style="green")
-
-            for key, val in self.options.items():
-                table.add_row(key, val["desc"])
-
-            self.console.print(table)
+            self.console.print(self._rendered_main_menu)
 
             choice = (
                 Prompt.ask("[bold yellow]Select an option[/bold yellow]")
@@ -620,25 +856,23 @@ class EditorMenu:
                 self.console.input("Press Enter to continue...")
                 continue
 
-            action_func = selected_option.get("func")
+            desc, action_func = selected_option["desc"], selected_option["func"]
 
             if action_func is None:
                 logger.info("Exiting Editor Menu. User selected 'Back'.")
                 break
 
-            self.console.print(f"[cyan]Executing:[/cyan] {selected_option.get('desc')}")
-            logger.info(
-                "Executing Editor Menu action: '%s'", selected_option.get("desc")
-            )
+            self.console.print(f"[cyan]Executing:[/cyan] {desc}")
+            logger.info("Executing Editor Menu action: '%s'", desc)
             try:
                 action_func()
             except Exception:
                 logger.critical(
-                    f"An unhandled error occurred while running '{selected_option.get('desc')}' in Editor Menu.",
+                    f"An unhandled error occurred while running '{desc}' in Editor Menu.",
                     exc_info=True,
                 )
                 self.console.print(
-                    f"[bold red]An unexpected error occurred while running '{selected_option.get('desc')}'. Check logs for details.[/bold red]"
+                    f"[bold red]An unexpected error occurred while running '{desc}'. Check logs for details.[/bold red]"
                 )
                 self.console.input("Press Enter to continue...")
 
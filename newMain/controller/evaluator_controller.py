@@ -1,22 +1,32 @@
 import logging
-from rich.console import Console
+import os
 from rich.table import Table
 from rich.prompt import Prompt
 from pathlib import Path
 
-from sqlalchemy.orm import joinedload
+from sqlalchemy import func, select
 
 from services.evaluator import Evaluator, EvaluatorInitialization
 from config import config
+from controller._shared import console, parallel_map
 from database.session_manager import get_session
 from database.models import JobInfo, VideoInfo
 
 logger = logging.getLogger(__name__)
 
 
+def _check_job_directories(jobs) -> list[bool]:
+    """Returns, per job, whether it has a job_directory that exists on disk."""
+
+    def check(job):
+        return bool(job.job_directory) and os.path.exists(job.job_directory)
+
+    return parallel_map(check, jobs)
+
+
 class EvaluatorMenu:
     def __init__(self):
-        self.console = Console()
+        self.console = console
         self.options = {
             "1": {
                 "desc": "Run evaluation for a single job",
@@ -28,6 +38,10 @@ class EvaluatorMenu:
             },
             "b": {"desc": "Back to Main Menu", "func": None},
         }
+        # Job rows queried by _get_all_jobs_from_db, reused until the job_info
+        # (count, max(updated_at)) fingerprint changes.
+        self._jobs_cache: list | None = None
+        self._jobs_cache_fingerprint: tuple | None = None
         logger.debug("EvaluatorMenu initialized.")
 
     def run(self):
@@ -40,10 +54,15 @@ class EvaluatorMenu:
             try:
                 all_jobs = self._get_all_jobs_from_db()
                 initializer = EvaluatorInitialization()
-                for job_data in all_jobs:
+
+                def initialize(job_data):
                     job_dir = Path(job_data["job_directory"])
-                    logger.debug(f"Auto-initializing {job_dir.name}")
+                    logger.debug("Auto-initializing %s", job_dir.name)
                     initializer.run_initialization(job_dir)
+
+                # Each job only touches its own paragraphs.json and the initializer
+                # holds no state, so the file I/O can overlap across threads.
+                parallel_map(initialize, all_jobs)
                 logger.info("Automatic initialization complete for all jobs.")
             except Exception as e:
                 logger.error(f"Automatic initialization failed: {e}", exc_info=True)
@@ -70,17 +89,17 @@ class EvaluatorMenu:
                 self.console.input("Press Enter to continue...")
                 continue
 
-            action_func = selected_option.get("func")
+            desc, action_func = selected_option["desc"], selected_option["func"]
             if action_func is None:
                 logger.info("Exiting Evaluator Menu.")
                 break
 
-            self.console.print(f"[cyan]Executing:[/cyan] {selected_option['desc']}")
+            self.console.print(f"[cyan]Executing:[/cyan] {desc}")
             try:
                 action_func()
             except Exception as e:
                 logger.critical(
-                    f"An unhandled error occurred while running '{selected_option['desc']}'. Error: {e}",
+                    f"An unhandled error occurred while running '{desc}'. Error: {e}",
                     exc_info=True,
                 )
                 self.console.print(
@@ -110,19 +129,41 @@ class EvaluatorMenu:
         jobs_list = []
         try:
             with get_session() as session:
-                jobs = (
-                    session.query(JobInfo)
-                    .options(joinedload(JobInfo.video))
-                    .order_by(JobInfo.id)
-                    .all()
+                fingerprint = tuple(
+                    session.query(
+                        func.count(JobInfo.id), func.max(JobInfo.updated_at)
+                    ).one()
                 )
-                for job in jobs:
-                    if job.job_directory and Path(job.job_directory).exists():
+                if (
+                    self._jobs_cache is not None
+                    and fingerprint == self._jobs_cache_fingerprint
+                ):
+                    # Only the query is skipped; directories are re-checked below,
+                    # so one deleted since the last listing drops out.
+                    logger.debug("Job table unchanged; using cached job rows.")
+                    jobs = self._jobs_cache
+                else:
+                    # Only the columns the listing needs; no ORM objects or loaders.
+                    stmt = (
+                        select(
+                            JobInfo.id,
+                            JobInfo.job_ulid,
+                            JobInfo.job_directory,
+                            VideoInfo.title,
+                        )
+                        .outerjoin(VideoInfo, JobInfo.video_id == VideoInfo.id)
+                        .order_by(JobInfo.id)
+                    )
+                    jobs = session.execute(stmt).all()
+                    self._jobs_cache = jobs
+                    self._jobs_cache_fingerprint = fingerprint
+                for job, directory_ok in zip(jobs, _check_job_directories(jobs)):
+                    if directory_ok:
                         jobs_list.append(
                             {
                                 "id": job.id,
                                 "job_ulid": job.job_ulid,
-                                "title": job.video.title if job.video else "N/A",
+                                "title": job.title or "N/A",
                                 "job_directory": job.job_directory,
                             }
                         )
@@ -1,49 +1,185 @@
 import logging
-from rich.console import Console
+import os
+from contextlib import nullcontext
+from functools import cached_property
+from rich.console import Group
 from rich.panel import Panel
 from rich.text import Text
 from rich.prompt import Prompt
 
 from pathlib import Path
+from typing import NamedTuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from database.session_manager import get_session
 from database.models import JobInfo, JobStage, StageState
-from sqlalchemy import and_
-from sqlalchemy.orm import aliased
+from sqlalchemy import lambda_stmt, select, update
+from sqlalchemy.orm import aliased, raiseload
 
 from services.formatter import Formatter
 from config import config
+from controller._shared import console, parallel_map
 
 logger = logging.getLogger(__name__)
 
+# last_error stored when the Formatter gives up without a result (quota, API error,
+# or too much word loss after retries).
+_NO_FORMATTER_RESULT_ERROR = "Formatting failed: Gemini API quota exceeded, API error, or excessive word loss after retries."
+
+# Queued format_gemini stage updates are flushed in batches of this size.
+_STAGE_UPDATE_BATCH = 25
+
+
+# Aliases for JobStage to filter on two different stages for the same JobInfo
+_TranscribeWhisperStage = aliased(JobStage, name="transcribe_whisper_stage")
+_FormatGeminiStage = aliased(JobStage, name="format_gemini_stage")
+
+
+def _format_candidates_stmt(job_id=None):
+    """
+    Statement for jobs whose transcribe_whisper stage succeeded and whose format_gemini
+    stage is pending or failed, optionally narrowed to one job. Only the values the
+    format handlers use are selected: (job_id, job_ulid, job_directory,
+    whisper_output_path, format_stage_id).
+    Built as a lambda_stmt so SQLAlchemy compiles it once and reuses the cached SQL;
+    job_id is bound as a parameter.
+    """
+    stmt = lambda_stmt(
+        lambda: select(
+            JobInfo.id.label("job_id"),
+            JobInfo.job_ulid,
+            JobInfo.job_directory,
+            _TranscribeWhisperStage.output_path.label("whisper_output_path"),
+            _FormatGeminiStage.id.label("format_stage_id"),
+        )
+        .join(_TranscribeWhisperStage, JobInfo.stages)
+        .join(_FormatGeminiStage, JobInfo.stages)
+        .where(
+            _TranscribeWhisperStage.stage_name == "transcribe_whisper",
+            _TranscribeWhisperStage.state == StageState.success,
+            _FormatGeminiStage.stage_name == "format_gemini",
+            _FormatGeminiStage.state.in_([StageState.pending, StageState.failed]),
+        )
+    )
+    if job_id is not None:
+        stmt += lambda s: s.where(JobInfo.id == job_id)
+    return stmt
+
+
+def _is_file(path):
+    """os.path.isfile that treats a missing (None/empty) path as no file."""
+    return bool(path) and os.path.isfile(path)
+
+
+class _JobOutcome(NamedTuple):
+    """Result of formatting one job; `halt` asks a bulk run to stop starting new jobs."""
+
+    state: StageState
+    output_path: str | None = None
+    last_error: str | None = None
+    halt: bool = False
+
+
+def _stage_values(state, output_path=None, last_error=None):
+    """Column values to write to a format_gemini stage for one job's outcome."""
+    values = {"state": state}
+    if output_path:
+        values["output_path"] = output_path
+    if last_error:
+        values["last_error"] = last_error
+    return values
+
+
+def _commit_stage_values(session, stage, values):
+    """Applies _stage_values() to a loaded JobStage and commits it."""
+    for column, value in values.items():
+        setattr(stage, column, value)
+    session.add(stage)
+    session.commit()
+
+
+def _flush_stage_updates(session, stage_updates):
+    """
+    Writes queued JobStage changes (dicts keyed by "id") in one UPDATE and commits
+    them, so a crash loses at most one batch and the write lock is not held
+    between batches.
+    """
+    if not stage_updates:
+        return
+    session.execute(update(JobStage), stage_updates)
+    session.commit()
+    logger.debug("Committed %d queued stage updates.", len(stage_updates))
+    stage_updates.clear()
+
+
+class _NullStatus:
+    """Stands in for a rich Status when no spinner is shown."""
+
+    def update(self, *args, **kwargs):
+        pass
+
+    def stop(self):
+        pass
+
 
 class FormatTranscriptionController:
     def __init__(self):
-        self.console = Console()
-        self.formatter = Formatter()
+        self.console = console
+        self._rendered_menu = None  # (console width, rendered menu text)
         logger.debug("FormatTranscriptionController initialized.")
 
+    def _status(self, message):
+        """
+        console.status() on a terminal. When output is piped there is nothing to
+        animate, so no spinner thread is started and status updates are dropped.
+        """
+        if self.console.is_terminal:
+            return self.console.status(message, spinner=config.SPINNER)
+        return nullcontext(_NullStatus())
+
+    @cached_property
+    def formatter(self):
+        """The Formatter service, built on first use so opening the menu stays cheap."""
+        logger.debug("Creating Formatter for FormatTranscriptionController.")
+        return Formatter()
+
+    def _get_rendered_menu(self):
+        """
+        Returns the menu banner and options as terminal output, rendered once per
+        console width and then reused on every redraw.
+        """
+        width = self.console.width
+        if self._rendered_menu is None or self._rendered_menu[0] != width:
+            options = Text()
+            options.append("1.", style="bold blue")
+            options.append(" Format All Pending Transcriptions\n")
+            options.append("2.", style="bold blue")
+            options.append(" Format Selected Transcription\n")
+            options.append("b.", style="bold red")
+            options.append(" Back to Main Menu")
+            with self.console.capture() as capture:
+                self.console.print(
+                    Group(
+                        Panel(
+                            Text(
+                                "Format Transcription Menu",
+                                justify="center",
+                                style="bold green",
+                            ),
+                            style="bold green",
+                        ),
+                        options,
+                    )
+                )
+            self._rendered_menu = (width, capture.get())
+        return self._rendered_menu[1]
+
     def run(self):
         logger.info("Format Transcription Menu started. Displaying menu.")
         while True:
             self.console.clear()
-            self.console.print(
-                Panel(
-                    Text(
-                        "Format Transcription Menu",
-                        justify="center",
-                        style="bold green",
-                    )
-                ),
-                style="bold green",
-            )
-            self.console.print(
-                "[bold blue]1.[/bold blue] Format All Pending Transcriptions"
-            )
-            self.console.print(
-                "[bold blue]2.[/bold blue] Format Selected Transcription"
-            )
-            self.console.print("[bold red]b.[/bold red] Back to Main Menu")
+            self.console.file.write(self._get_rendered_menu())
+            self.console.file.flush()
 
             choice = Prompt.ask(
                 "[bold green]Choose an option[/bold green]",
@@ -82,6 +218,84 @@ class FormatTranscriptionController:
 
         logger.info("Exited Format Transcription Menu.")
 
+    def _check_stages(
+        self, job_ulid, whisper_output_path, has_format_stage, transcript_exists=None
+    ):
+        """
+        Checks that a job has a usable whisper transcript and a format_gemini stage.
+        `transcript_exists` can carry a precomputed file check; otherwise it is done here.
+        Reports any problem and returns the error to store on the stage, or None if ready.
+        """
+        if transcript_exists is None:
+            transcript_exists = _is_file(whisper_output_path)
+        if not transcript_exists:
+            logger.error(
+                f"Missing transcribe_whisper output, output path, or file not found for job {job_ulid}. Skipping."
+            )
+            self.console.print(
+                f"[bold red]Error: No successful 'transcribe_whisper' stage, output path missing, or transcript file not found for job [cyan]{job_ulid}[/cyan]. Skipping.[/bold red]"
+            )
+            return "Missing transcribe_whisper output or file not found."
+
+        if not has_format_stage:
+            logger.error(f"'format_gemini' stage not found for job {job_ulid}. Skipping.")
+            self.console.print(
+                f"[bold red]Error: 'format_gemini' stage not found for job [cyan]{job_ulid}[/cyan]. Skipping.[/bold red]"
+            )
+            return "'format_gemini' stage not found."
+
+        return None
+
+    def _process_one_job(self, formatter, job_ulid, job_directory, input_file_path):
+        """
+        Runs `formatter` for one job and prints the outcome.
+        Touches no database state, so it is safe on a worker thread; callers apply
+        the returned _JobOutcome's state, output_path and last_error to the job's
+        format_gemini stage.
+        """
+        try:
+            logger.info(f"Calling Formatter service for Job ULID: {job_ulid}.")
+            output_file_path = formatter.run(
+                job_directory=job_directory,
+                input_file_path=input_file_path,
+                job_label=job_ulid,
+            )
+        except RuntimeError as e:
+            logger.error(
+                f"RuntimeError during formatting for job {job_ulid}: {e}", exc_info=True
+            )
+            self.console.print(
+                f"[bold red]Failed to format transcription for job [cyan]{job_ulid}[/cyan]: {e}[/bold red]"
+            )
+            return _JobOutcome(StageState.failed, last_error=str(e))
+        except Exception as e:
+            logger.critical(
+                f"An unexpected error occurred during formatting for job {job_ulid}: {e}",
+                exc_info=True,
+            )
+            self.console.print(
+                f"[bold red]An unexpected error occurred for job [cyan]{job_ulid}[/cyan]: {e}[/bold red]"
+            )
+            return _JobOutcome(StageState.failed, last_error=str(e))
+
+        if output_file_path is None:
+            logger.warning(
+                f"Formatter returned None for job {job_ulid}. Marking as failed."
+            )
+            # No result at all usually means quota or API trouble that the next
+            # job would hit too.
+            return _JobOutcome(
+                StageState.failed, last_error=_NO_FORMATTER_RESULT_ERROR, halt=True
+            )
+
+        logger.info(
+            f"Successfully formatted and saved for job {job_ulid}. Output path: {output_file_path}."
+        )
+        self.console.print(
+            f"[bold green]Successfully formatted and saved for job [cyan]{job_ulid}[/cyan].[/bold green]"
+        )
+        return _JobOutcome(StageState.success, output_path=str(output_file_path))
+
     def format_selected_transcription(self):
         logger.info("Starting 'Format Selected Transcription' process.")
         self.console.print(
@@ -107,9 +321,8 @@ class FormatTranscriptionController:
             Prompt.ask("Press Enter to continue...")
             return
 
-        with self.console.status(
-            f"[bold green]Searching for job {job_id} to format...[/bold green]",
-            spinner=config.SPINNER,
+        with self._status(
+            f"[bold green]Searching for job {job_id} to format...[/bold green]"
         ) as status:
             try:
                 with get_session() as session:
@@ -118,25 +331,9 @@ class FormatTranscriptionController:
                         f"Querying for Job ID {job_id} with transcribe_whisper success and format_gemini pending."
                     )
 
-                    # Create aliases for JobStage to filter on two different stages for the same JobInfo
-                    TranscribeWhisperStage = aliased(JobStage)
-                    FormatGeminiStage = aliased(JobStage)
-
-                    job_to_format = (
-                        session.query(JobInfo)
-                        .filter(JobInfo.id == job_id)
-                        .join(TranscribeWhisperStage, JobInfo.stages)
-                        .join(FormatGeminiStage, JobInfo.stages)
-                        .filter(
-                            TranscribeWhisperStage.stage_name == "transcribe_whisper",
-                            TranscribeWhisperStage.state == StageState.success,
-                            FormatGeminiStage.stage_name == "format_gemini",
-                            FormatGeminiStage.state.in_(
-                                [StageState.pending, StageState.failed]
-                            ),
-                        )
-                        .first()
-                    )
+                    job_to_format = session.execute(
+                        _format_candidates_stmt(job_id)
+                    ).first()
 
                     if not job_to_format:
                         logger.warning(
@@ -153,7 +350,7 @@ class FormatTranscriptionController:
 
                     job = job_to_format  # for clarity
                     logger.info(
-                        f"Found job {job.job_ulid} (ID: {job.id}) ready for formatting."
+                        f"Found job {job.job_ulid} (ID: {job.job_id}) ready for formatting."
                     )
                     self.console.print(
                         f"[bold green]Found job [cyan]{job.job_ulid}[/cyan] ready for formatting.[/bold green]"
@@ -162,113 +359,49 @@ class FormatTranscriptionController:
                         f"[bold green]Processing transcription for job [cyan]{job.job_ulid}[/cyan]...[/bold green]"
                     )
 
-                    whisper_stage = next(
-                        (s for s in job.stages if s.stage_name == "transcribe_whisper"),
-                        None,
-                    )
-                    format_gemini_stage = next(
-                        (s for s in job.stages if s.stage_name == "format_gemini"), None
+                    # The stage row is only loaded now that there is something to write.
+                    # raiseload("*") makes any accidental relationship access fail loudly
+                    # instead of quietly issuing another query.
+                    format_gemini_stage = session.get(
+                        JobStage, job.format_stage_id, options=[raiseload("*")]
                     )
 
-                    if (
-                        not whisper_stage
-                        or not whisper_stage.output_path
-                        or not Path(whisper_stage.output_path).exists()
-                    ):
-                        logger.error(
-                            f"Missing transcribe_whisper output, output path, or file not found for job {job.job_ulid}."
-                        )
-                        self.console.print(
-                            f"[bold red]Error: No successful 'transcribe_whisper' stage, output path missing, or transcript file not found for job [cyan]{job.job_ulid}[/cyan]. Skipping.[/bold red]"
-                        )
+                    stage_error = self._check_stages(
+                        job.job_ulid,
+                        job.whisper_output_path,
+                        format_gemini_stage is not None,
+                    )
+                    if stage_error:
                         if format_gemini_stage:
-                            format_gemini_stage.state = StageState.failed
-                            format_gemini_stage.last_error = (
-                                "Missing transcribe_whisper output or file not found."
+                            _commit_stage_values(
+                                session,
+                                format_gemini_stage,
+                                _stage_values(StageState.failed, last_error=stage_error),
                             )
-                            session.add(format_gemini_stage)
-                            session.commit()
                             logger.info(
                                 f"Updated format_gemini stage to FAILED for Job {job.job_ulid} due to missing whisper output."
                             )
                         Prompt.ask("Press Enter to continue...")
                         return
 
-                    if not format_gemini_stage:
-                        logger.error(
-                            f"'format_gemini' stage not found for job {job.job_ulid}. Skipping."
-                        )
-                        self.console.print(
-                            f"[bold red]Error: 'format_gemini' stage not found for job [cyan]{job.job_ulid}[/cyan]. Skipping.[/bold red]"
-                        )
-                        Prompt.ask("Press Enter to continue...")
-                        return
-
-                    try:
-                        logger.info(
-                            f"Calling Formatter service for Job ULID: {job.job_ulid}."
-                        )
-                        output_file_path = self.formatter.run(
-                            job_directory=Path(job.job_directory),
-                            input_file_path=Path(whisper_stage.output_path),
-                        )
-
-                        if output_file_path is None:
-                            logger.warning(
-                                f"Formatter returned None for job {job.job_ulid}. Marking as failed."
-                            )
-                            status.update(
-                                f"[yellow]Skipping job [cyan]{job.job_ulid}[/cyan] due to formatting failure.[/yellow]"
-                            )
-                            format_gemini_stage.state = StageState.failed
-                            format_gemini_stage.last_error = "Formatting failed: Gemini API quota exceeded, API error, or excessive word loss after retries."
-                            session.add(format_gemini_stage)
-                            session.commit()
-                            logger.info(
-                                f"Updated format_gemini stage to FAILED for Job {job.job_ulid} in DB."
-                            )
-                        else:
-                            format_gemini_stage.state = StageState.success
-                            format_gemini_stage.output_path = str(output_file_path)
-                            session.add(format_gemini_stage)
-                            session.commit()
-                            logger.info(
-                                f"Successfully formatted and saved for job {job.job_ulid}. Output path: {output_file_path}."
-                            )
-                            self.console.print(
-                                f"[bold green]Successfully formatted and saved for job [cyan]{job.job_ulid}[/cyan].[/bold green]"
-                            )
-
-                    except RuntimeError as e:
-                        logger.error(
-                            f"RuntimeError during formatting for job {job.job_ulid}: {e}",
-                            exc_info=True,
-                        )
-                        self.console.print(
-                            f"[bold red]Failed to format transcription for job [cyan]{job.job_ulid}[/cyan]: {e}[/bold red]"
-                        )
-                        format_gemini_stage.state = StageState.failed
-                        format_gemini_stage.last_error = str(e)
-                        session.add(format_gemini_stage)
-                        session.commit()
-                        logger.info(
-                            f"Updated format_gemini stage to FAILED for Job {job.job_ulid} in DB due to RuntimeError."
-                        )
-                    except Exception as e:
-                        logger.critical(
-                            f"An unexpected error occurred during formatting for job {job.job_ulid}: {e}",
-                            exc_info=True,
-                        )
-                        self.console.print(
-                            f"[bold red]An unexpected error occurred for job [cyan]{job.job_ulid}[/cyan]: {e}[/bold red]"
-                        )
-                        format_gemini_stage.state = StageState.failed
-                        format_gemini_stage.last_error = str(e)
-                        session.add(format_gemini_stage)
-                        session.commit()
-                        logger.info(
-                            f"Updated format_gemini stage to FAILED for Job {job.job_ulid} in DB due to unexpected error."
+                    state, output_path, last_error, halt = self._process_one_job(
+                        self.formatter,
+                        job.job_ulid,
+                        Path(job.job_directory),
+                        Path(job.whisper_output_path),
+                    )
+                    if halt:
+                        status.update(
+                            f"[yellow]Skipping job [cyan]{job.job_ulid}[/cyan] due to formatting failure.[/yellow]"
                         )
+                    _commit_stage_values(
+                        session,
+                        format_gemini_stage,
+                        _stage_values(state, output_path, last_error),
+                    )
+                    logger.info(
+                        f"Updated format_gemini stage to {state.name.upper()} for Job {job.job_ulid} in DB."
+                    )
 
             except Exception as e:
                 logger.critical(
@@ -297,9 +430,8 @@ class FormatTranscriptionController:
             style="bold yellow",
         )
 
-        with self.console.status(
-            "[bold green]Searching for transcriptions to format...[/bold green]",
-            spinner=config.SPINNER,
+        with self._status(
+            "[bold green]Searching for transcriptions to format...[/bold green]"
         ) as status:
             try:
                 with get_session() as session:
@@ -308,26 +440,20 @@ class FormatTranscriptionController:
                         "Querying for jobs with transcribe_whisper success and format_gemini pending/failed."
                     )
 
-                    # Create aliases for JobStage to filter on two different stages for the same JobInfo
-                    TranscribeWhisperStage = aliased(JobStage)
-                    FormatGeminiStage = aliased(JobStage)
-
-                    jobs_to_format = (
-                        session.query(JobInfo)
-                        .join(TranscribeWhisperStage, JobInfo.stages)
-                        .join(FormatGeminiStage, JobInfo.stages)
-                        .filter(
-                            TranscribeWhisperStage.stage_name == "transcribe_whisper",
-                            TranscribeWhisperStage.state == StageState.success,
-                            FormatGeminiStage.stage_name == "format_gemini",
-                            FormatGeminiStage.state.in_(
-                                [StageState.pending, StageState.failed]
-                            ),
+                    # Plain column rows; no ORM objects or stage collections are
+                    # loaded for the candidates. The whole list is needed up front
+                    # for the count and the batched transcript checks below.
+                    job_rows = [
+                        (
+                            row.job_ulid,
+                            row.job_directory,
+                            row.whisper_output_path,
+                            row.format_stage_id,
                         )
-                        .all()
-                    )
+                        for row in session.execute(_format_candidates_stmt())
+                    ]
 
-                    if not jobs_to_format:
+                    if not job_rows:
                         logger.info(
                             "No transcriptions found ready for formatting (transcribe_whisper success and format_gemini pending/failed)."
                         )
@@ -339,134 +465,151 @@ class FormatTranscriptionController:
                         )
                         return
 
-                    logger.info(
-                        f"Found {len(jobs_to_format)} transcriptions to format."
-                    )
+                    logger.info(f"Found {len(job_rows)} transcriptions to format.")
                     self.console.print(
-                        f"[bold green]Found {len(jobs_to_format)} transcriptions to format.[/bold green]"
+                        f"[bold green]Found {len(job_rows)} transcriptions to format.[/bold green]"
                     )
-                    for i, job in enumerate(jobs_to_format):
-                        status.update(
-                            f"[bold green]Processing transcription {i + 1}/{len(jobs_to_format)} for job [cyan]{job.job_ulid}[/cyan]...[/bold green]"
-                        )
-                        logger.info(
-                            f"Processing transcription {i + 1}/{len(jobs_to_format)} for Job ULID: {job.job_ulid} (ID: {job.id})."
-                        )
 
-                        whisper_stage = next(
-                            (
-                                s
-                                for s in job.stages
-                                if s.stage_name == "transcribe_whisper"
-                            ),
-                            None,
-                        )
-                        format_gemini_stage = next(
-                            (s for s in job.stages if s.stage_name == "format_gemini"),
-                            None,
-                        )
+                    # Stage changes are queued and written as executemany UPDATEs,
+                    # committed every _STAGE_UPDATE_BATCH jobs.
+                    stage_updates = []
 
-                        if (
-                            not whisper_stage
-                            or not whisper_stage.output_path
-                            or not Path(whisper_stage.output_path).exists()
-                        ):
-                            logger.error(
-                                f"Missing transcribe_whisper output, output path, or file not found for job {job.job_ulid}. Skipping."
-                            )
-                            self.console.print(
-                                f"[bold red]Error: No successful 'transcribe_whisper' stage, output path missing, or transcript file not found for job [cyan]{job.job_ulid}[/cyan]. Skipping.[/bold red]"
-                            )
-                            if format_gemini_stage:
-                                format_gemini_stage.state = StageState.failed
-                                format_gemini_stage.last_error = "Missing transcribe_whisper output or file not found."
-                                session.add(format_gemini_stage)
-                                session.commit()
+                    def record_stage_update(stage_id, values):
+                        stage_updates.append({"id": stage_id, **values})
+                        if len(stage_updates) >= _STAGE_UPDATE_BATCH:
+                            _flush_stage_updates(session, stage_updates)
+
+                    # Validate on the main thread first; only ready jobs go to the pool.
+                    # All transcript checks are done up front, overlapped on a pool.
+                    transcripts_exist = parallel_map(
+                        _is_file, (row[2] for row in job_rows)
+                    )
+                    ready_jobs = []
+                    # Hoisted out of the per-job loop below.
+                    check_stages = self._check_stages
+                    add_ready_job = ready_jobs.append
+                    failed = StageState.failed
+                    to_path = Path
+                    for (
+                        job_ulid,
+                        job_directory,
+                        whisper_output_path,
+                        stage_id,
+                    ), transcript_exists in zip(job_rows, transcripts_exist):
+                        stage_error = check_stages(
+                            job_ulid,
+                            whisper_output_path,
+                            stage_id is not None,
+                            transcript_exists,
+                        )
+                        if stage_error:
+                            if stage_id is not None:
+                                record_stage_update(
+                                    stage_id,
+                                    _stage_values(failed, last_error=stage_error),
+                                )
                                 logger.info(
-                                    f"Updated format_gemini stage to FAILED for Job {job.job_ulid} due to missing whisper output."
+                                    f"Updated format_gemini stage to FAILED for Job {job_ulid} due to missing whisper output."
                                 )
                             continue
 
-                        if not format_gemini_stage:
-                            logger.error(
-                                f"'format_gemini' stage not found for job {job.job_ulid}. Skipping."
-                            )
-                            self.console.print(
-                                f"[bold red]Error: 'format_gemini' stage not found for job [cyan]{job.job_ulid}[/cyan]. Skipping.[/bold red]"
+                        add_ready_job(
+                            (
+                                job_ulid,
+                                to_path(job_directory),
+                                to_path(whisper_output_path),
+                                stage_id,
                             )
-                            continue
+                        )
 
-                        try:
-                            logger.info(
-                                f"Calling Formatter service for Job ULID: {job.job_ulid}."
-                            )
-                            output_file_path = self.formatter.run(
-                                job_directory=Path(job.job_directory),
-                                input_file_path=Path(whisper_stage.output_path),
+                    # Formatting is bound by Gemini round-trips, so up to
+                    # FORMAT_CONCURRENCY jobs run at once. Workers only call the
+                    # Formatter; every DB write stays on this thread, since the
+                    # session isn't thread-safe.
+                    halted = False
+                    completed = 0
+                    # Build the shared Formatter here rather than racing to create
+                    # it from several workers.
+                    formatter = self.formatter
+                    executor = ThreadPoolExecutor(max_workers=config.FORMAT_CONCURRENCY)
+                    # A job is only handed out when a worker is free, so nothing is
+                    # queued behind the running ones: after a halt, an error or
+                    # Ctrl-C there is no backlog left to send to Gemini.
+                    pending_jobs = iter(ready_jobs)
+                    in_flight = {}
+
+                    def submit_next_job():
+                        job = next(pending_jobs, None)
+                        if job is None:
+                            return
+                        job_ulid, job_directory, input_file_path, stage_id = job
+                        future = executor.submit(
+                            self._process_one_job,
+                            formatter,
+                            job_ulid,
+                            job_directory,
+                            input_file_path,
+                        )
+                        in_flight[future] = (job_ulid, stage_id)
+
+                    def record_result(future):
+                        nonlocal completed, halted
+                        job_ulid, stage_id = in_flight.pop(future)
+                        if future.cancelled():
+                            return
+                        if future.exception() is not None:
+                            logger.error(
+                                "Formatting worker for job %s raised.",
+                                job_ulid,
+                                exc_info=future.exception(),
                             )
+                            return
+                        completed += 1
+                        status.update(
+                            f"[bold green]Formatted {completed}/{len(ready_jobs)} transcriptions (last: [cyan]{job_ulid}[/cyan])...[/bold green]"
+                        )
 
-                            if output_file_path is None:
-                                logger.warning(
-                                    f"Formatter returned None for job {job.job_ulid}. Marking as failed and stopping all further processing."
-                                )
-                                status.update(
-                                    f"[yellow]Stopping all further formatting for [cyan]{job.job_ulid}[/cyan] due to critical failure (e.g., Gemini quota).[/yellow]"
-                                )
+                        state, output_path, last_error, halt = future.result()
+                        if halt:
+                            last_error = f"{last_error} Processing halted."
+                            if not halted:
+                                halted = True
                                 self.console.print(
                                     "[bold red]Critical error encountered (e.g., Gemini API quota exceeded). Stopping all further formatting tasks.[/bold red]"
                                 )
-                                format_gemini_stage.state = StageState.failed
-                                format_gemini_stage.last_error = "Formatting failed: Gemini API quota exceeded, API error, or excessive word loss after retries. Processing halted."
-                                session.add(format_gemini_stage)
-                                session.commit()
-                                logger.info(
-                                    f"Updated format_gemini stage to FAILED for Job {job.job_ulid} in DB and breaking loop."
-                                )
-                                break  # <--- THIS IS THE KEY CHANGE: Stop the loop
 
-                            format_gemini_stage.state = StageState.success
-                            format_gemini_stage.output_path = str(output_file_path)
-                            session.add(format_gemini_stage)
-                            session.commit()
-                            logger.info(
-                                f"Successfully formatted and saved for job {job.job_ulid}. Output path: {output_file_path}."
-                            )
-                            self.console.print(
-                                f"[bold green]Successfully formatted and saved for job [cyan]{job.job_ulid}[/cyan].[/bold green]"
-                            )
+                        record_stage_update(
+                            stage_id,
+                            _stage_values(state, output_path, last_error),
+                        )
 
-                        except RuntimeError as e:
-                            logger.error(
-                                f"RuntimeError during formatting for job {job.job_ulid}: {e}",
-                                exc_info=True,
-                            )
-                            self.console.print(
-                                f"[bold red]Failed to format transcription for job [cyan]{job.job_ulid}[/cyan]: {e}[/bold red]"
-                            )
-                            format_gemini_stage.state = StageState.failed
-                            format_gemini_stage.last_error = str(e)
-                            session.add(format_gemini_stage)
-                            session.commit()
-                            logger.info(
-                                f"Updated format_gemini stage to FAILED for Job {job.job_ulid} in DB due to RuntimeError."
-                            )
-                            continue
-                        except Exception as e:
-                            logger.critical(
-                                f"An unexpected error occurred during formatting for job {job.job_ulid}: {e}",
-                                exc_info=True,
-                            )
-                            self.console.print(
-                                f"[bold red]An unexpected error occurred for job [cyan]{job.job_ulid}[/cyan]: {e}[/bold red]"
-                            )
-                            format_gemini_stage.state = StageState.failed
-                            format_gemini_stage.last_error = str(e)
-                            session.add(format_gemini_stage)
-                            session.commit()
-                            logger.info(
-                                f"Updated format_gemini stage to FAILED for Job {job.job_ulid} in DB due to unexpected error."
-                            )
-                            continue
+                    try:
+                        for _ in range(config.FORMAT_CONCURRENCY):
+                            submit_next_job()
+                        while in_flight:
+                            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                record_result(future)
+                                # After a halt, jobs already running finish and are
+                                # still recorded, but no new ones start.
+                                if not halted:
+                                    submit_next_job()
+                    except BaseException:
+                        logger.warning(
+                            "Bulk formatting interrupted; waiting for %d running jobs.",
+                            len(in_flight),
+                        )
+                        self.console.print(
+                            "[yellow]Formatting interrupted. Waiting for the jobs already running to finish...[/yellow]"
+                        )
+                        raise
+                    finally:
+                        # Jobs already sent to Gemini are waited for and recorded, so
+                        # the next run does not format (and bill) them again.
+                        executor.shutdown(wait=True, cancel_futures=True)
+                        for future in list(in_flight):
+                            record_result(future)
+                        _flush_stage_updates(session, stage_updates)
 
                     status.update(
                         "[bold green]Finished processing all pending transcriptions.[/bold green]"
@@ -1,110 +1,234 @@
 import logging
-from rich.console import Console
+import os
+import time
+from rich.console import Group
 from rich.table import Table
 from rich.prompt import Prompt
+from rich.text import Text
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import json
 
 from database.session_manager import get_session
 from database.models import JobInfo, JobStage, StageState
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import aliased
 from services.metadata_extractor import MetadataExtractor
 from config import config
+from controller._shared import console
 
 logger = logging.getLogger(__name__)
-console = Console()  # Console for user interaction messages
+
+# Threads used to read candidate metadata.json files in parallel.
+_METADATA_READ_WORKERS = 16
+# Candidate rows fetched per round trip while streaming the eligibility query.
+_CANDIDATE_FETCH_BATCH = 1000
+# Results from _load_metadata for files that could not be parsed.
+_METADATA_MISSING = object()
+_METADATA_CORRUPT = object()
+# Parsed metadata.json per path with the (mtime_ns, size) it was read at, so an
+# unchanged file is not parsed again on the next listing.
+_metadata_file_cache = {}
+# Eligible job list from _get_jobs_for_metadata_processing, reused while the
+# job_stage fingerprint is unchanged and the entry is younger than the TTL.
+_ELIGIBLE_CACHE_TTL_SECONDS = 30
+_eligible_cache = {"fingerprint": None, "cached_at": 0.0, "jobs": None}
+
+
+# Built once at import so each call reuses the same statement (and its
+# compiled form from SQLAlchemy's statement cache). One join per stage;
+# (job_id, stage_name) is unique, so each job appears at most once and no
+# DISTINCT is needed.
+_FormatGeminiStage = aliased(JobStage)
+_ExtractMetadataStage = aliased(JobStage)
+_METADATA_CANDIDATES_STMT = (
+    select(
+        JobInfo.id.label("job_id"),
+        JobInfo.job_ulid.label("job_ulid"),
+        JobInfo.job_directory.label("job_directory"),
+        _ExtractMetadataStage.state.label("metadata_stage_state"),
+    )
+    .join(
+        _FormatGeminiStage,
+        and_(
+            _FormatGeminiStage.job_id == JobInfo.id,
+            _FormatGeminiStage.stage_name == "format_gemini",
+            _FormatGeminiStage.state == StageState.success,
+        ),
+    )
+    .join(
+        _ExtractMetadataStage,
+        and_(
+            _ExtractMetadataStage.job_id == JobInfo.id,
+            _ExtractMetadataStage.stage_name == "extract_metadata",
+        ),
+    )
+)
+_STAGE_FINGERPRINT_STMT = select(func.count(JobStage.id))
+
+
+def _load_metadata(metadata_path):
+    """Reads and parses one metadata.json, returning a sentinel or the exception on failure."""
+    # A bare os.open/fstat/read: the open doubles as the existence check, and
+    # the fstat size lets an empty file be rejected and the rest read at once.
+    # The fstat also says whether the file changed since it was last parsed.
+    try:
+        fd = os.open(metadata_path, os.O_RDONLY)
+    except FileNotFoundError:
+        return _METADATA_MISSING
+    except Exception as e:
+        return e
+    try:
+        file_stat = os.fstat(fd)
+        file_version = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = _metadata_file_cache.get(metadata_path)
+        if cached is not None and cached[0] == file_version:
+            return cached[1]
+        size = file_stat.st_size
+        if size == 0:
+            return _METADATA_CORRUPT
+        chunks = []
+        while size > 0:
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+        metadata = json.loads(b"".join(chunks))
+    except json.JSONDecodeError:
+        return _METADATA_CORRUPT
+    except Exception as e:
+        return e
+    finally:
+        os.close(fd)
+    if not isinstance(metadata, dict):
+        return _METADATA_CORRUPT
+    _metadata_file_cache[metadata_path] = (file_version, metadata)
+    return metadata
+
+
+def _eligible_job(job_data):
+    """Builds the job dict the menu lists from one candidate row."""
+    return {
+        "id": job_data["job_id"],
+        "job_ulid": job_data["job_ulid"],
+        "job_directory": job_data["job_directory"],
+        "metadata_stage_state": job_data["metadata_stage_state"].value,
+    }
+
+
+def _stage_table_fingerprint(session):
+    """
+    Returns a cheap row-count fingerprint of the job_stage table. It catches new
+    stages; a state change on an existing stage shows up once the cache TTL runs out.
+    """
+    return session.execute(_STAGE_FINGERPRINT_STMT).scalar_one()
+
+
+def _invalidate_eligible_cache():
+    """Drops the cached eligible job list so the next lookup re-queries."""
+    _eligible_cache["fingerprint"] = None
+    _eligible_cache["jobs"] = None
 
 
 def _get_jobs_for_metadata_processing():
     """
     Retrieves jobs where 'format_gemini' is successful and the metadata.json file
     is either missing or has null categories.
+
+    Every candidate's metadata.json is checked on disk; a file whose mtime and
+    size are unchanged since it was last parsed is not parsed again.
     """
     logger.debug("Querying for jobs eligible for metadata processing.")
     eligible_jobs = []
     try:
         with get_session() as session:
-            successful_format_gemini_jobs = (
-                session.query(JobStage.job_id)
-                .filter(
-                    JobStage.stage_name == "format_gemini",
-                    JobStage.state == StageState.success,
-                )
-                .subquery()
-            )
-            logger.debug("Subquery for successful 'format_gemini' jobs executed.")
-
-            candidate_jobs_query = (
-                session.query(
-                    JobInfo.id.label("job_id"),
-                    JobInfo.job_ulid.label("job_ulid"),
-                    JobInfo.job_directory.label("job_directory"),
-                    JobStage.state.label("metadata_stage_state"),
-                )
-                .join(JobStage, JobInfo.id == JobStage.job_id)
-                .filter(
-                    JobInfo.id == successful_format_gemini_jobs.c.job_id,
-                    JobStage.stage_name == "extract_metadata",
-                )
-                .distinct()
-                .all()
-            )
+            fingerprint = _stage_table_fingerprint(session)
+            if (
+                _eligible_cache["jobs"] is not None
+                and _eligible_cache["fingerprint"] == fingerprint
+                and time.monotonic() - _eligible_cache["cached_at"]
+                <= _ELIGIBLE_CACHE_TTL_SECONDS
+            ):
+                logger.debug("Reusing cached list of jobs eligible for metadata.")
+                return list(_eligible_cache["jobs"])
+
+            # Rows stream in batches and each file read is submitted as its row
+            # arrives, so disk IO overlaps the rest of the fetch.
+            candidate_count = 0
+            pending_jobs = []  # (row, metadata path, pending read)
+            with ThreadPoolExecutor(max_workers=_METADATA_READ_WORKERS) as executor:
+                for job_data in session.execute(
+                    _METADATA_CANDIDATES_STMT,
+                    execution_options={"yield_per": _CANDIDATE_FETCH_BATCH},
+                ).mappings():
+                    candidate_count += 1
+                    metadata_path = (
+                        Path(job_data["job_directory"]) / config.METADATA_FILE_NAME
+                    )
+                    pending_jobs.append(
+                        (
+                            job_data,
+                            metadata_path,
+                            executor.submit(_load_metadata, metadata_path),
+                        )
+                    )
             logger.debug(
-                f"Found {len(candidate_jobs_query)} candidate jobs for metadata processing."
+                "Found %d candidate jobs for metadata processing.", candidate_count
             )
 
-            for job_data in candidate_jobs_query:
-                job_directory = Path(job_data.job_directory)
-                metadata_path = job_directory / config.METADATA_FILE_NAME
+        categories = tuple(config.METADATA_CATEGORIES)
+        for job_data, metadata_path, pending_read in pending_jobs:
+            metadata = pending_read.result()
+            needs_processing = True
 
-                needs_processing = False
-
-                if not metadata_path.exists():
-                    logger.info(
-                        f"Metadata file not found at {metadata_path} for job {job_data.job_ulid}. Marking as eligible."
-                    )
-                    needs_processing = True
+            if metadata is _METADATA_MISSING:
+                logger.info(
+                    "Metadata file not found at %s for job %s. Marking as eligible.",
+                    metadata_path,
+                    job_data["job_ulid"],
+                )
+            elif metadata is _METADATA_CORRUPT:
+                logger.error(
+                    "Corrupt metadata.json for job %s at %s. Marking as eligible.",
+                    job_data["job_ulid"],
+                    metadata_path,
+                )
+                console.print(
+                    f"[red]Warning: Corrupt metadata.json for job {job_data['job_ulid']} at {metadata_path}. Marking as eligible.[/red]"
+                )
+            elif isinstance(metadata, Exception):
+                logger.error(
+                    "Error checking metadata.json for job %s at %s.",
+                    job_data["job_ulid"],
+                    metadata_path,
+                    exc_info=metadata,
+                )
+                console.print(
+                    f"[red]Error reading metadata.json for job {job_data['job_ulid']} at {metadata_path}. Marking as eligible.[/red]"
+                )
+            else:
+                missing = next(
+                    (c for c in categories if metadata.get(c) is None), None
+                )
+                if missing is None:
+                    needs_processing = False
                 else:
-                    try:
-                        with open(metadata_path, "r") as f:
-                            metadata = json.load(f)
-
-                        for category in config.METADATA_CATEGORIES:
-                            if metadata.get(category) is None:
-                                logger.debug(
-                                    f"Job {job_data.job_ulid} metadata '{category}' is null. Marking as eligible."
-                                )
-                                needs_processing = True
-                                break
-                    except json.JSONDecodeError:
-                        logger.error(
-                            f"Corrupt metadata.json for job {job_data.job_ulid} at {metadata_path}. Marking as eligible.",
-                            exc_info=True,
-                        )
-                        console.print(
-                            f"[red]Warning: Corrupt metadata.json for job {job_data.job_ulid} at {metadata_path}. Marking as eligible.[/red]"
-                        )
-                        needs_processing = True
-                    except Exception:
-                        logger.error(
-                            f"Error checking metadata.json for job {job_data.job_ulid} at {metadata_path}.",
-                            exc_info=True,
-                        )
-                        console.print(
-                            f"[red]Error reading metadata.json for job {job_data.job_ulid} at {metadata_path}. Marking as eligible.[/red]"
-                        )
-                        needs_processing = True
-
-                if needs_processing:
-                    eligible_jobs.append(
-                        {
-                            "id": job_data.job_id,
-                            "job_ulid": job_data.job_ulid,
-                            "job_directory": job_data.job_directory,
-                            "metadata_stage_state": job_data.metadata_stage_state.value,
-                        }
+                    logger.debug(
+                        "Job %s metadata '%s' is null. Marking as eligible.",
+                        job_data["job_ulid"],
+                        missing,
                     )
+
+            if needs_processing:
+                eligible_jobs.append(_eligible_job(job_data))
+
+        _eligible_cache["fingerprint"] = fingerprint
+        _eligible_cache["cached_at"] = time.monotonic()
+        _eligible_cache["jobs"] = list(eligible_jobs)
+
         logger.info(
-            f"Identified {len(eligible_jobs)} jobs eligible for metadata processing."
+            "Identified %d jobs eligible for metadata processing.", len(eligible_jobs)
         )
     except Exception:
         logger.error(
@@ -117,9 +241,11 @@ def _display_jobs(jobs, title="Available Jobs"):
     """
     Displays a list of jobs in a formatted table.
     """
-    logger.debug(f"Displaying jobs table for: '{title}'. Number of jobs: {len(jobs)}")
+    logger.debug(
+        "Displaying jobs table for: '%s'. Number of jobs: %d", title, len(jobs)
+    )
     if not jobs:
-        logger.info(f"No jobs to display for '{title}'.")
+        logger.info("No jobs to display for '%s'.", title)
         console.print(f"[bold yellow]No {title.lower()} found.[/bold yellow]")
         return
 
@@ -130,11 +256,12 @@ def _display_jobs(jobs, title="Available Jobs"):
     table.add_column("Metadata Status", style="yellow")
 
     for job in jobs:
+        # Text cells skip the markup parser (and any brackets in directory names)
         table.add_row(
-            str(job["id"]),
-            job["job_ulid"],
-            job["job_directory"],
-            job["metadata_stage_state"],
+            Text(str(job["id"])),
+            Text(job["job_ulid"]),
+            Text(job["job_directory"]),
+            Text(job["metadata_stage_state"]),
         )
     console.print(table)
 
@@ -144,7 +271,7 @@ def _run_metadata_processing(job_ids: list[int]):
     Iterates through job IDs and triggers the metadata processing service.
     Stops if a Gemini quota error is encountered.
     """
-    logger.info(f"Running metadata processing for job IDs: {job_ids}")
+    logger.info("Running metadata processing for job IDs: %s", job_ids)
     if not job_ids:
         logger.warning("No job IDs provided for metadata processing.")
         console.print(
@@ -152,38 +279,58 @@ def _run_metadata_processing(job_ids: list[int]):
         )
         return
 
-    for job_id in job_ids:
-        logger.info(f"Processing metadata for Job ID: {job_id}.")
-        try:
-            extractor = MetadataExtractor(job_id=job_id)
-            # The process_metadata method now returns False specifically on a quota error
-            should_continue = extractor.process_metadata()
+    # One session for the batch, committed after every job: a failure or
+    # Ctrl-C only loses the job in progress, and SQLite's write lock is held
+    # just for each job's final stage update, never across the LLM calls.
+    with get_session() as session:
+        for job_id in job_ids:
+            logger.info("Processing metadata for Job ID: %s.", job_id)
+            try:
+                extractor = MetadataExtractor(job_id=job_id, session=session)
+                # The process_metadata method now returns False specifically on a quota error
+                should_continue = extractor.process_metadata()
+                session.commit()
 
-            if should_continue:
-                logger.info(
-                    f"Successfully finished processing metadata for Job ID: {job_id}."
-                )
-                console.print(
-                    f"[bold green]Finished processing metadata for Job ID: {job_id}.[/bold green]\n"
-                )
-            else:
-                # A quota error occurred
-                logger.warning(
-                    "Metadata processing aborted due to Gemini API quota error."
+                if should_continue:
+                    logger.info(
+                        "Successfully finished processing metadata for Job ID: %s.",
+                        job_id,
+                    )
+                    console.print(
+                        f"[bold green]Finished processing metadata for Job ID: {job_id}.[/bold green]\n"
+                    )
+                else:
+                    # A quota error occurred
+                    logger.warning(
+                        "Metadata processing aborted due to Gemini API quota error."
+                    )
+                    console.print(
+                        "[bold red]Gemini API quota has been hit. Aborting further processing.[/bold red]"
+                    )
+                    Prompt.ask("Press Enter to return to the menu...")
+                    break  # Stop processing the rest of the jobs
+
+            except Exception:
+                # Leave the session usable for the next job
+                session.rollback()
+                logger.error(
+                    "Error processing metadata for Job ID: %s.", job_id, exc_info=True
                 )
                 console.print(
-                    "[bold red]Gemini API quota has been hit. Aborting further processing.[/bold red]"
+                    f"[bold red]Error processing metadata for Job ID: {job_id}. Check logs.[/bold red]\n"
                 )
-                Prompt.ask("Press Enter to return to the menu...")
-                break  # Stop processing the rest of the jobs
 
-        except Exception:
-            logger.error(
-                f"Error processing metadata for Job ID: {job_id}.", exc_info=True
-            )
-            console.print(
-                f"[bold red]Error processing metadata for Job ID: {job_id}. Check logs.[/bold red]\n"
-            )
+    # metadata.json files may have changed even where no stage row did
+    _invalidate_eligible_cache()
+
+
+# Static menu text, parsed once instead of on every pass through the loop.
+_MENU_FRAME = Group(
+    Text.from_markup("\n[bold]Metadata Generator Menu[/bold]"),
+    Text("1. Process all eligible jobs"),
+    Text("2. Select jobs manually"),
+    Text("0. Back to Main Menu"),
+)
 
 
 def metadata_generator_menu():
@@ -193,10 +340,7 @@ def metadata_generator_menu():
     logger.info("Metadata Generator Menu started. Displaying menu.")
     while True:
         console.clear()
-        console.print("\n[bold]Metadata Generator Menu[/bold]")
-        console.print("1. Process all eligible jobs")
-        console.print("2. Select jobs manually")
-        console.print("0. Back to Main Menu")
+        console.print(_MENU_FRAME)
 
         choice = Prompt.ask("[bold]Enter your choice:[/bold] ")
         logger.debug("User selected menu option: '%s'", choice)
@@ -236,6 +380,7 @@ def metadata_generator_menu():
             _display_jobs(jobs_for_selection, title="Jobs with Metadata to Process")
 
             if jobs_for_selection:
+                valid_id_set = frozenset(job["id"] for job in jobs_for_selection)
                 while True:
                     selected_ids_input = Prompt.ask(
                         "[bold]Enter Job IDs to process (comma-separated), or 'b' to go back:[/bold] "
@@ -254,9 +399,7 @@ def metadata_generator_menu():
                             if x.strip()
                         ]
                         valid_selected_ids = [
-                            job_id
-                            for job_id in selected_ids
-                            if job_id in [job["id"] for job in jobs_for_selection]
+                            job_id for job_id in selected_ids if job_id in valid_id_set
                         ]
                         logger.debug("Valid selected Job IDs: %s", valid_selected_ids)
                         if valid_selected_ids:
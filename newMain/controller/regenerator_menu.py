@@ -1,8 +1,9 @@
 import logging
-from rich.console import Console
+from functools import cached_property
 from rich.prompt import Prompt
 
 from services.evaluator import UserInteractiveEvaluator
+from controller._shared import console
 
 logger = logging.getLogger(__name__)
 
@@ -13,8 +14,12 @@ class RegeneratorMenu:
     """
 
     def __init__(self):
-        self.console = Console()
-        self.user_evaluator = UserInteractiveEvaluator(self.console)
+        self.console = console
+
+    @cached_property
+    def user_evaluator(self):
+        """The interactive evaluator, built on first use so going straight back stays cheap."""
+        return UserInteractiveEvaluator(self.console)
 
     def run(self):
         """
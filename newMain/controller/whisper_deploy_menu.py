@@ -1,26 +1,37 @@
 import logging
-from rich.console import Console
+from functools import cached_property
+from rich.console import Group
 from rich.table import Table
 from rich.prompt import Prompt
+from rich.text import Text
 
 from services import whisper_deployer
 from config import config
+from controller._shared import console
 
 logger = logging.getLogger(__name__)
 
 
 class Menu:
     def __init__(self):
-        self.console = Console()
+        self.console = console
         self.options = {
             "1": {"desc": "Deploy Pending Jobs", "func": self._deploy},
             "2": {"desc": "Check For Completed Jobs", "func": self._recover},
             "3": {"desc": "Manually Retrieve Job", "func": self._manually_recover},
             "b": {"desc": "Back to Main Menu", "func": None},
         }
-        self.deployer = whisper_deployer.Deployer()
+        # The options never change while the menu is open, so the frame and
+        # choice list are built once and reused on every redraw.
+        self._menu_frame = self._build_menu_frame()
+        self._choices = list(self.options)
         logger.debug("Whisper Deploy Menu initialized with options: %s", self.options)
-        logger.debug("whisper_deployer.Deployer instance created.")
+
+    @cached_property
+    def deployer(self):
+        """The whisper Deployer, built on first use so opening the menu stays cheap."""
+        logger.debug("Creating whisper_deployer.Deployer instance.")
+        return whisper_deployer.Deployer()
 
     def run(self):
         logger.info("Whisper Deploy Menu started. Displaying menu.")
@@ -30,7 +41,7 @@ class Menu:
             self._display_menu()
             choice = Prompt.ask(
                 "[bold green]Enter your choice[/bold green]",
-                choices=list(self.options.keys()),
+                choices=self._choices,
             ).lower()
             logger.debug("User selected menu option: '%s'", choice)
 
@@ -40,16 +51,18 @@ class Menu:
 
             action = self.options.get(choice)
             if action and action["func"]:
-                logger.info("Executing Whisper Deploy action: '%s'", action.get("desc"))
+                desc, action_func = action["desc"], action["func"]
+                logger.info("Executing Whisper Deploy action: '%s'", desc)
                 try:
-                    action["func"]()
+                    action_func()
                 except Exception:
                     logger.critical(
-                        f"An unhandled error occurred while running '{action.get('desc')}' in Whisper Deploy Menu.",
+                        "An unhandled error occurred while running '%s' in Whisper Deploy Menu.",
+                        desc,
                         exc_info=True,
                     )
                     self.console.print(
-                        f"[bold red]An unexpected error occurred while running '{action.get('desc')}'. Check logs for details.[/bold red]"
+                        f"[bold red]An unexpected error occurred while running '{desc}'. Check logs for details.[/bold red]"
                     )
                     self.console.input("Press Enter to continue...")
             else:
@@ -59,17 +72,22 @@ class Menu:
             Prompt.ask("Press Enter to continue...")
         logger.info("Exited Whisper Deploy Menu.")
 
-    def _display_menu(self):
-        logger.debug("Displaying Whisper Deployment Menu options.")
-        self.console.print("[bold cyan]Whisper Deployment Menu[/bold cyan]")
+    def _build_menu_frame(self):
+        """Builds the menu heading and options table from self.options."""
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Option", style="dim", width=12)
         table.add_column("Description")
 
         for key, value in self.options.items():
-            table.add_row(key, value["desc"])
+            table.add_row(Text(key), Text(value["desc"]))
 
-        self.console.print(table)
+        return Group(
+            Text.from_markup("[bold cyan]Whisper Deployment Menu[/bold cyan]"), table
+        )
+
+    def _display_menu(self):
+        logger.debug("Displaying Whisper Deployment Menu options.")
+        self.console.print(self._menu_frame)
 
     def _deploy(self):
         logger.info("Calling deploy_pending_jobs from whisper_deployer.")
@@ -100,10 +118,12 @@ class Menu:
         if job_id:
             try:
                 self.deployer.recover_specific_job(job_id)
-                logger.info(f"Manual recovery initiated for Job ID: {job_id}.")
+                logger.info("Manual recovery initiated for Job ID: %s.", job_id)
             except Exception:
                 logger.error(
-                    f"Error during manual recovery for Job ID: {job_id}.", exc_info=True
+                    "Error during manual recovery for Job ID: %s.",
+                    job_id,
+                    exc_info=True,
                 )
                 self.console.print(
                     f"[red]An error occurred during manual recovery for Job ID {job_id}. Check logs for details.[/red]"
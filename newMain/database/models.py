@@ -15,6 +15,7 @@ from sqlalchemy import (
     Boolean,
     ForeignKey,
     UniqueConstraint,
+    Index,
     Enum,
     Text,
 )
@@ -100,6 +101,11 @@ class JobInfo(Base):
     stages = relationship("JobStage", back_populates="job")
     video = relationship("VideoInfo")  # Add this line
 
+    @property
+    def stages_by_name(self):
+        """This job's stages keyed by stage_name (unique per job)."""
+        return {stage.stage_name: stage for stage in self.stages}
+
 
 logger.debug("JobInfo ORM model defined.")
 
@@ -107,8 +113,14 @@ logger.debug("JobInfo ORM model defined.")
 class JobStage(Base):
     __tablename__ = "job_stage"
 
-    # Define a unique constraint to ensure each job has unique stage names
-    __table_args__ = (UniqueConstraint("job_id", "stage_name"),)
+    # Define a unique constraint to ensure each job has unique stage names.
+    # The index backs the stage eligibility filters used by the menus
+    # (e.g. stage_name == "format_gemini" AND state == success). job_id is the
+    # trailing column so those filters are answered from the index alone.
+    __table_args__ = (
+        UniqueConstraint("job_id", "stage_name"),
+        Index("ix_jobstage_name_state_job", "stage_name", "state", "job_id"),
+    )
 
     # Primary key and foreign key to JobInfo
     id = Column(Integer, primary_key=True)
@@ -12,6 +12,11 @@ from config import config
 
 logger = logging.getLogger(__name__)
 
+# Stored in a paragraph's "edited" field when editing it raised an exception.
+EDIT_ERROR_MARKER = "[ERROR] - See logs for details."
+# "edited" values meaning the paragraph still has to be sent for editing.
+UNEDITED_MARKERS = frozenset({None, EDIT_ERROR_MARKER})
+
 
 class Editor:
     """Class to handle paragraph editing using an Ollama-compatible API."""
@@ -132,20 +137,24 @@ class Editor:
         return paragraphs_data
 
     def _save_paragraphs_to_file(self, data, file_path):
-        """Saves the paragraph data to the JSON file."""
+        """Saves the paragraph data to the JSON file. Returns True on success."""
         logger.debug(f"Saving paragraph data to {file_path}")
         try:
             with open(file_path, "w") as f:
                 json.dump(data, f, indent=4)
+            return True
         except Exception:
             logger.error(f"Error saving paragraph data to {file_path}", exc_info=True)
+            return False
 
     def _load_paragraphs_from_file(self, file_path):
         """Loads paragraph data from a JSON file."""
         logger.debug(f"Loading paragraphs from {file_path}")
         try:
-            with open(file_path, "r") as f:
-                return json.load(f)
+            # One binary read straight into json.loads, skipping the text-mode
+            # decode/join that json.load(f) does over the file object.
+            with open(file_path, "rb") as f:
+                return json.loads(f.read())
         except FileNotFoundError:
             logger.error(f"Paragraphs JSON file not found at {file_path}")
             return None
@@ -165,45 +174,56 @@ class Editor:
         logger.debug(f"Paragraph file path determined to be: {path}")
         return path
 
+    def _get_stage(self, session, stage_name):
+        """Returns this job's stage row with the given name, or None."""
+        return (
+            session.query(JobStage)
+            .filter_by(job_id=self.job_id, stage_name=stage_name)
+            .first()
+        )
+
     def run_editor(self):
-        """Orchestrates the sermon editing process (initial JSON creation)."""
+        """
+        Orchestrates the sermon editing process (initial JSON creation).
+        Returns True if paragraphs.json was written and its path recorded.
+        """
         logger.info(f"Running editor (JSON creation) for Job ID: {self.job_id}")
         with get_session() as session:
             job = session.query(JobInfo).filter(JobInfo.id == self.job_id).first()
             if not job:
                 logger.error(f"Job with ID {self.job_id} not found in the database.")
-                return
+                return False
 
-            format_gemini_stage = (
-                session.query(JobStage)
-                .filter_by(job_id=self.job_id, stage_name="format_gemini")
-                .first()
-            )
+            format_gemini_stage = self._get_stage(session, "format_gemini")
             if not format_gemini_stage or not format_gemini_stage.output_path:
                 logger.warning(
                     f"Formatted transcript path not found in 'format_gemini' stage for Job ID: {self.job_id}. Cannot create paragraphs.json."
                 )
-                return
+                return False
 
             transcript_path = Path(format_gemini_stage.output_path)
             if not transcript_path.exists():
                 logger.error(
                     f"Transcript file not found at the path specified in the database: {transcript_path}"
                 )
-                return
+                return False
 
             paragraph_file_path = self._get_paragraph_file_path(job.job_directory)
             if paragraph_file_path.exists():
                 logger.info(
                     f"Paragraphs JSON file already exists at {paragraph_file_path}. Skipping creation."
                 )
+                return False
             else:
                 logger.info("Paragraphs JSON file not found. Creating...")
                 transcript_text = transcript_path.read_text()
                 paragraphs_data = self._build_paragraphs_json_data(
                     transcript_text, job.job_directory
                 )
-                self._save_paragraphs_to_file(paragraphs_data, paragraph_file_path)
+                if not self._save_paragraphs_to_file(
+                    paragraphs_data, paragraph_file_path
+                ):
+                    return False
 
                 logger.debug(
                     f"Updating database for 'format_gemini' stage with path: {paragraph_file_path}"
@@ -213,6 +233,7 @@ class Editor:
                 logger.info(
                     f"Committed paragraph_json_path to database for Job ID: {self.job_id}"
                 )
+                return True
 
     def process_paragraphs_for_editing(self):
         """Loads paragraphs.json and sends unedited ones to the Ollama API."""
@@ -241,10 +262,7 @@ class Editor:
             edited_this_run = 0
 
             for i, p_entry in enumerate(paragraphs_data):
-                if (
-                    p_entry.get("edited") is None
-                    or p_entry.get("edited") == "[ERROR] - See logs for details."
-                ):
+                if p_entry.get("edited") in UNEDITED_MARKERS:
                     status_message = f"Processing paragraph {i+1}/{total_paragraphs} for Job ID {self.job_id}..."
                     logger.info(status_message)
                     with self.console.status(status_message, spinner=config.SPINNER):
@@ -278,7 +296,7 @@ class Editor:
                                 f"Error processing paragraph {i+1} for Job ID {self.job_id} with Ollama.",
                                 exc_info=True,
                             )
-                            p_entry["edited"] = f"[ERROR] - See logs for details."
+                            p_entry["edited"] = EDIT_ERROR_MARKER
                             self._save_paragraphs_to_file(
                                 paragraphs_data, paragraph_file_path
                             )  # Save error state
@@ -300,11 +318,7 @@ class Editor:
                 logger.info(
                     f"All {total_paragraphs} paragraphs for Job ID {self.job_id} are now edited."
                 )
-                edit_llm_stage = (
-                    session.query(JobStage)
-                    .filter_by(job_id=self.job_id, stage_name="edit_local_llm")
-                    .first()
-                )
+                edit_llm_stage = self._get_stage(session, "edit_local_llm")
                 if edit_llm_stage and edit_llm_stage.state != StageState.success:
                     edit_llm_stage.state = StageState.success
                     session.commit()
@@ -15,6 +15,7 @@ from pathlib import Path
 from typing import Optional, List, Tuple
 import time
 import re
+import threading
 import json
 
 from joshlib.gemini import GeminiClient
@@ -49,6 +50,7 @@ class Formatter:
         # Configuration for Ollama's sentence-based chunking.
         self.sentence_chunk_size = 25
         self.context_paragraph_count = 1
+        self._prompt_lock = threading.Lock()
         logger.debug("Formatter initialized.")
 
     def _clean_text(self, text: str) -> str:
@@ -77,7 +79,12 @@ class Formatter:
 
         return text
 
-    def run(self, job_directory: Path, input_file_path: Path) -> Optional[Path]:
+    def run(
+        self,
+        job_directory: Path,
+        input_file_path: Path,
+        job_label: Optional[str] = None,
+    ) -> Optional[Path]:
         """
         Executes the main formatting workflow. It first attempts to use Gemini,
         and if that fails or produces an unsatisfactory result (based on word count),
@@ -86,10 +93,14 @@ class Formatter:
         Args:
             job_directory (Path): The directory for the current job, where output will be saved.
             input_file_path (Path): The path to the raw (or whisper-transcribed) text file.
+            job_label (Optional[str]): Names the job in the fallback prompts, so the user
+                knows which job is asking when several are formatted at once. Defaults
+                to the job directory name.
 
         Returns:
             Optional[Path]: The path to the formatted output file if successful, otherwise None.
         """
+        job_label = job_label or job_directory.name
         try:
             raw_text = input_file_path.read_text(encoding="utf-8")
 
@@ -156,60 +167,63 @@ class Formatter:
                     )
                     time.sleep(15)
 
-            # If after all Gemini attempts, we still don't have a satisfactory formatted_text.
-            if not formatted_text:
-                logger.warning(
-                    "All Gemini formatting attempts failed (or threshold exceeded)."
-                )
-                self.console.print(
-                    "[bold red]Gemini formatting failed or was rejected after 3 attempts.[/bold red]"
-                )
-
-                # If Gemini did return a result, even if it failed the threshold, offer to proceed with it.
-                if last_attempt_result:
-                    gemini_count = len(last_attempt_result.split())
-                    diff = gemini_count - original_word_count
-                    # Prompt user to accept the high-variance Gemini result or discard it.
-                    if (
-                        Prompt.ask(
-                            f"[bold yellow]Word count mismatch detected. Gemini: {gemini_count} Original: {original_word_count}. Difference: {diff} words. Proceed?[/bold yellow]",
-                            choices=["y", "n"],
-                            default="n",
-                        ).lower()
-                        == "y"
-                    ):
-                        formatted_text = last_attempt_result  # User chose to accept the divergent Gemini result.
-
-                # If we still don't have formatted_text (either no Gemini result or user rejected it).
+            # The fallback decisions prompt the user; when several jobs are formatted
+            # concurrently, only one of them may ask at a time.
+            with self._prompt_lock:
+                # If after all Gemini attempts, we still don't have a satisfactory formatted_text.
                 if not formatted_text:
-                    # Tier 2: Offer Ollama as a fallback.
-                    if (
-                        Prompt.ask(
-                            "[bold cyan]Would you like to use Ollama as a fallback for formatting?[/bold cyan]",
-                            choices=["y", "n"],
-                            default="y",
-                        ).lower()
-                        == "y"
-                    ):
-                        logger.info("User opted for Ollama fallback.")
-                        self.console.print(
-                            "[bold blue]Starting Ollama fallback formatting (this may take a while)...[/bold blue]"
-                        )
-                        paragraphs = self._run_ollama_formatting(clean_text)
-                        if paragraphs:
-                            formatted_text = "\n\n".join(paragraphs)
+                    logger.warning(
+                        "All Gemini formatting attempts failed (or threshold exceeded)."
+                    )
+                    self.console.print(
+                        f"[bold red]Job {job_label}: Gemini formatting failed or was rejected after 3 attempts.[/bold red]"
+                    )
+
+                    # If Gemini did return a result, even if it failed the threshold, offer to proceed with it.
+                    if last_attempt_result:
+                        gemini_count = len(last_attempt_result.split())
+                        diff = gemini_count - original_word_count
+                        # Prompt user to accept the high-variance Gemini result or discard it.
+                        if (
+                            Prompt.ask(
+                                f"[bold yellow]Job {job_label}: Word count mismatch detected. Gemini: {gemini_count} Original: {original_word_count}. Difference: {diff} words. Proceed?[/bold yellow]",
+                                choices=["y", "n"],
+                                default="n",
+                            ).lower()
+                            == "y"
+                        ):
+                            formatted_text = last_attempt_result  # User chose to accept the divergent Gemini result.
+
+                    # If we still don't have formatted_text (either no Gemini result or user rejected it).
+                    if not formatted_text:
+                        # Tier 2: Offer Ollama as a fallback.
+                        if (
+                            Prompt.ask(
+                                f"[bold cyan]Job {job_label}: Would you like to use Ollama as a fallback for formatting?[/bold cyan]",
+                                choices=["y", "n"],
+                                default="y",
+                            ).lower()
+                            == "y"
+                        ):
+                            logger.info("User opted for Ollama fallback.")
                             self.console.print(
-                                "[bold green]Ollama fallback successful.[/bold green]"
+                                "[bold blue]Starting Ollama fallback formatting (this may take a while)...[/bold blue]"
                             )
+                            paragraphs = self._run_ollama_formatting(clean_text)
+                            if paragraphs:
+                                formatted_text = "\n\n".join(paragraphs)
+                                self.console.print(
+                                    "[bold green]Ollama fallback successful.[/bold green]"
+                                )
+                            else:
+                                logger.error("Ollama fallback also failed.")
+                                self.console.print(
+                                    "[bold red]Ollama fallback failed.[/bold red]"
+                                )
+                                return None  # Ollama fallback also failed.
                         else:
-                            logger.error("Ollama fallback also failed.")
-                            self.console.print(
-                                "[bold red]Ollama fallback failed.[/bold red]"
-                            )
-                            return None  # Ollama fallback also failed.
-                    else:
-                        logger.info("User declined Ollama fallback.")
-                        return None  # User declined all formatting options.
+                            logger.info("User declined Ollama fallback.")
+                            return None  # User declined all formatting options.
 
             # Save the final formatted text to a file.
             output_path = job_directory / "formatted_transcript.txt"
@@ -1,5 +1,6 @@
 import json  # For working with JSON data (metadata files)
 import logging  # For logging events and debugging information
+from contextlib import nullcontext  # Stand-in context for an injected session
 from pathlib import Path  # For object-oriented filesystem paths
 from typing import Dict, Any  # For type hinting, especially for dictionary structures
 
@@ -27,14 +28,17 @@ logger = logging.getLogger(__name__)
 class MetadataExtractor:
     # ... (docstring remains as updated)
 
-    def __init__(self, job_id: int):
+    def __init__(self, job_id: int, session=None):
         """
         Initializes the MetadataExtractor for a specific job.
 
         Args:
             job_id (int): The unique identifier for the job being processed.
+            session: Optional caller-owned database session. When given, stage
+                updates are only flushed and the caller commits them after the job.
         """
         self.job_id = job_id  # Store the job ID
+        self.session = session  # Shared session, or None to open our own
         self.console = Console()  # Rich console instance for formatted output
         # Define the directory where LLM prompts for metadata generation are stored
         self.prompts_dir = Path(__file__).parent / "prompts" / "metadata"
@@ -352,8 +356,11 @@ class MetadataExtractor:
         """
         logger.info(f"Starting metadata processing for Job ID: {self.job_id}.")
         try:
-            # Establish a database session for the duration of this operation
-            with get_session() as session:
+            # Use the caller's session if one was injected, otherwise open our own
+            session_context = (
+                nullcontext(self.session) if self.session is not None else get_session()
+            )
+            with session_context as session:
                 # Fetch the JobInfo record for the current job ID
                 job = session.query(JobInfo).filter_by(id=self.job_id).first()
                 if not job:
@@ -532,7 +539,8 @@ class MetadataExtractor:
                     if metadata_stage and metadata_stage.state != StageState.success:
                         metadata_stage.state = StageState.success
                         session.add(metadata_stage)
-                        session.commit()  # Commit the change to the database
+                        # Flush only; get_session (or the caller's session) commits
+                        session.flush()
                         self.console.print(
                             f"[green]Job {job.job_ulid}: 'extract_metadata' stage marked as SUCCESS.[/green]"
                         )
@@ -556,6 +564,10 @@ class MetadataExtractor:
                 True  # Processing for this job is done (or failed for non-quota reason)
             )
         except Exception:
+            # Drop this job's uncommitted changes, as get_session would; the
+            # caller commits after every job, so earlier jobs are not affected
+            if self.session is not None:
+                self.session.rollback()
             # Catch any critical unexpected errors that occur during the overall process_metadata execution
             logger.critical(
                 f"A critical error occurred during metadata processing for Job ID: {self.job_id}.",
@@ -109,9 +109,7 @@ class Deployer:
             audio_segment_path = Path(job.job_directory) / config.MP3_SEGMENT_NAME
             logger.debug(f"Audio segment path: {audio_segment_path}")
 
-            whisper_stage = next(
-                (s for s in job.stages if s.stage_name == "transcribe_whisper"), None
-            )
+            whisper_stage = job.stages_by_name.get("transcribe_whisper")
 
             if not whisper_stage:
                 status.stop()
@@ -324,9 +322,7 @@ class Deployer:
             f"Checking status for job [bold cyan]{job.job_ulid}[/bold cyan]...",
             spinner=config.SPINNER,
         ) as status:
-            whisper_stage = next(
-                (s for s in job.stages if s.stage_name == "transcribe_whisper"), None
-            )
+            whisper_stage = job.stages_by_name.get("transcribe_whisper")
             if not whisper_stage:
                 status.stop()
                 logger.error(